@@ -76,6 +76,9 @@ class PadResolver:
             axis (Axis): Matplotlib axis (XAxis or YAxis) to inspect.
         """
         self.axis = axis
+        self._kind: Literal["x", "y"] | None = (
+            "x" if isinstance(axis, XAxis) else "y" if isinstance(axis, YAxis) else None
+        )
 
     def resolve(self) -> PadSettings:
         """Resolve pad settings for an axis.
@@ -84,11 +87,11 @@ class PadResolver:
             PadSettings: Direction and index used by PadStyler to apply an
             affine translation to tick label transforms.
         """
-        if isinstance(self.axis, XAxis):
+        if self._kind == "x":
             position = self.axis.get_ticks_position()
             direction = self._XAXIS_PAD_MAP.get(position, -1)
             index = 1
-        elif isinstance(self.axis, YAxis):
+        elif self._kind == "y":
             position = self.axis.get_ticks_position()
             direction = self._YAXIS_PAD_MAP.get(position, -1)
             index = 0
@@ -100,65 +103,74 @@ class PadResolver:
 
 
 class LabelStyler:
-    """Apply font, color, rotation, and alignment to tick label Text artists."""
+    """Apply font, color, rotation, alignment, and padding to tick labels."""
 
-    def __init__(self, labels: Sequence[Text], properties: LabelProperties) -> None:
+    def __init__(
+        self,
+        labels: Sequence[Text],
+        properties: LabelProperties,
+        offset: Affine2D | None = None,
+    ) -> None:
         """
         Args:
             labels (Sequence[Text]): Tick label Text artists to style.
             properties (LabelProperties): Styling properties to apply.
+            offset (Affine2D | None): Optional padding translation appended
+                to each label transform.
         """
         self.labels = labels
         self.properties = properties
-
-    def set_font_properties(self) -> None:
-        """Apply font-related properties (font, size, color, rotation)."""
-        for label in self.labels:
-            if self.properties.font is not None:
-                label.set_fontproperties(self.properties.font)
-            if self.properties.size is not None:
-                label.set_fontsize(self.properties.size)
-            if self.properties.color is not None:
-                label.set_color(self.properties.color)
-            if self.properties.rotation is not None:
-                label.set_rotation(self.properties.rotation)
-
-    def set_alignment(self) -> None:
-        """Apply alignment properties (vertical and horizontal alignment)."""
-        if self.properties.v_align is not None:
-            for label in self.labels:
-                label.set_verticalalignment(self.properties.v_align)
-        if self.properties.h_align is not None:
-            for label in self.labels:
-                label.set_horizontalalignment(self.properties.h_align)
+        self.offset = offset
 
     def style(self) -> None:
-        """Apply all configured styling properties to the labels."""
-        self.set_font_properties()
-        self.set_alignment()
+        """Apply all configured styling properties in a single pass.
+
+        Notes:
+            Each label is visited once; font, color, rotation, alignment, and
+            the padding transform are applied together.
+        """
+        font = self.properties.font
+        size = self.properties.size
+        color = self.properties.color
+        rotation = self.properties.rotation
+        v_align = self.properties.v_align
+        h_align = self.properties.h_align
+        offset = self.offset
+
+        for label in self.labels:
+            if offset is not None:
+                label.set_transform(label.get_transform() + offset)
+            if font is not None:
+                label.set_fontproperties(font)
+            if size is not None:
+                label.set_fontsize(size)
+            if color is not None:
+                label.set_color(color)
+            if rotation is not None:
+                label.set_rotation(rotation)
+            if v_align is not None:
+                label.set_verticalalignment(v_align)
+            if h_align is not None:
+                label.set_horizontalalignment(h_align)
 
 
 class PadStyler:
-    """Apply padding offsets to tick labels by translating their transforms."""
+    """Build the translation used to pad tick labels."""
 
-    def __init__(
-        self,
-        labels: Sequence[Text],
-        pad: float,
-        settings: PadSettings,
-    ) -> None:
+    def __init__(self, pad: float, settings: PadSettings) -> None:
         """
         Args:
-            labels (Sequence[Text]): Tick label Text artists to adjust.
             pad (float): Padding amount (interpreted via internal scaling).
             settings (PadSettings): Resolved direction and axis index.
         """
-        self.labels = labels
         self.pad = pad
         self.settings = settings
 
-    def set_pad(self) -> None:
-        """Apply the padding offset to tick labels.
+    def get_offset(self) -> Affine2D:
+        """Return the padding offset shared by all tick labels.
+
+        Returns:
+            Affine2D: Translation to append to each label transform.
 
         Notes:
             Padding is applied by translating the Text transform, not by
@@ -167,10 +179,7 @@ class PadStyler:
         pad_value = self.pad * 10 * self.settings.direction
         x_pad = pad_value if self.settings.index == 0 else 0
         y_pad = pad_value if self.settings.index == 1 else 0
-
-        for label in self.labels:
-            offset = Affine2D().translate(x_pad, y_pad)
-            label.set_transform(label.get_transform() + offset)
+        return Affine2D().translate(x_pad, y_pad)
 
 
 class TruncateFormatter:
@@ -327,11 +336,10 @@ class MajorLabelDrawer:
             )
             self.axis.set_major_formatter(truncator.create_formatter())
 
-        labels = self.axis.get_majorticklabels()
-
+        offset = None
         if pad is not None:
             settings = PadResolver(self.axis).resolve()
-            PadStyler(labels=labels, pad=pad, settings=settings).set_pad()
+            offset = PadStyler(pad=pad, settings=settings).get_offset()
 
         properties = LabelProperties(
             font=font,
@@ -341,7 +349,11 @@ class MajorLabelDrawer:
             v_align=v_align,
             h_align=h_align,
         )
-        LabelStyler(labels=labels, properties=properties).style()
+        LabelStyler(
+            labels=self.axis.get_majorticklabels(),
+            properties=properties,
+            offset=offset,
+        ).style()
         return self
 
     def format(
@@ -1,9 +1,16 @@
 """Style and format Matplotlib tick markers."""
 
-from dataclasses import dataclass
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Literal
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
-from matplotlib.axis import Axis, XAxis, YAxis
+import numpy as np
+from matplotlib import artist
+from matplotlib.artist import Artist
+from matplotlib.axis import Axis, Tick, XAxis, YAxis
 from matplotlib.lines import Line2D
 from matplotlib.markers import TICKDOWN, TICKLEFT, TICKRIGHT, TICKUP, MarkerStyle
 from matplotlib.ticker import AutoMinorLocator, MultipleLocator, NullLocator
@@ -21,8 +28,26 @@ LINE_MAP: dict[str, int] = {
     "line_down": TICKDOWN,
 }
 
+# (axis kind, ticks position) -> (tick1_active, tick2_active)
+_POSITION_TABLE: dict[tuple[str, str], tuple[bool, bool]] = {
+    ("x", "bottom"): (True, False),
+    ("x", "top"): (False, True),
+    ("x", "both"): (True, True),
+    ("x", "none"): (False, False),
+    ("y", "left"): (True, False),
+    ("y", "right"): (False, True),
+    ("y", "both"): (True, True),
+    ("y", "none"): (False, False),
+}
+
+# axis kind -> (tick1 default marker, tick2 default marker)
+_DEFAULT_MARKERS: dict[str | None, tuple[LineType, LineType]] = {
+    "x": ("line_down", "line_up"),
+    "y": ("line_left", "line_right"),
+}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarkerProperties:
     """Store styling properties for tick markers."""
 
@@ -38,7 +63,7 @@ class MarkerProperties:
     rotation: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarkerSettings:
     """Store resolved tick-side activation and default markers.
 
@@ -55,22 +80,116 @@ class MarkerSettings:
     tick2_marker: MarkerType
 
 
-class MarkerResolver:
-    """Resolve which tick markers are active and their default marker types."""
+def _resolve_marker(marker: MarkerType) -> MarkerType:
+    """Map LineType names to Matplotlib tick markers; pass other specs through."""
+    return LINE_MAP.get(marker, marker) if isinstance(marker, str) else marker
+
 
-    _YAXIS_POSITION_MAP = {
-        "left": (True, False),
-        "right": (False, True),
-        "both": (True, True),
-        "none": (False, False),
-    }
+def _first_set[T](value: T | None, fallback: T | None) -> T | None:
+    """Return `value`, or `fallback` when `value` is None."""
+    return fallback if value is None else value
 
-    _XAXIS_POSITION_MAP = {
-        "bottom": (True, False),
-        "top": (False, True),
-        "both": (True, True),
-        "none": (False, False),
-    }
+
+def _multiple_tick_count(vmin: float, vmax: float, step: float) -> int:
+    """Return len(MultipleLocator(step).tick_values(vmin, vmax)).
+
+    Mirrors the locator's arithmetic, including the 1e-10 tolerance its
+    edge rounding (ticker._Edge_integer.ge) applies to the first multiple,
+    without allocating the tick array.
+    """
+    low, high = sorted((vmin, vmax))
+    multiples, remainder = divmod(low, step)
+    if abs(remainder / step) >= 1e-10:
+        multiples += 1
+    first = multiples * step
+    return int((high - first + 0.001 * step) // step) + 3
+
+
+def _make_transform(
+    rotation: float, x_offset: float, y_offset: float
+) -> Affine2D | None:
+    """Build the rotate-then-translate transform applied to marker paths.
+
+    The combined matrix is written out directly rather than composed from
+    rotate_deg() and translate() stages. Returns None for the default
+    (identity) case so MarkerStyle skips the user transform entirely.
+    """
+    if rotation == 0 and x_offset == 0 and y_offset == 0:
+        return None
+
+    theta = math.radians(rotation)
+    cos, sin = math.cos(theta), math.sin(theta)
+    return Affine2D(
+        np.array(
+            [
+                [cos, -sin, x_offset],
+                [sin, cos, y_offset],
+                [0.0, 0.0, 1.0],
+            ]
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_marker_style(
+    marker: MarkerType,
+    fill_style: FillStyle,
+    cap_style: CapStyle,
+    rotation: float,
+    x_offset: float,
+    y_offset: float,
+) -> MarkerStyle:
+    """Build a MarkerStyle once per distinct configuration."""
+    return MarkerStyle(
+        marker=marker,
+        fillstyle=fill_style,
+        transform=_make_transform(rotation, x_offset, y_offset),
+        capstyle=cap_style,
+    )
+
+
+def _get_marker_style(marker: MarkerType, properties: MarkerProperties) -> MarkerStyle:
+    """Return the MarkerStyle for a resolved marker and style properties.
+
+    Styles are shared across tick lines and drawer instances. Marker specs
+    that are not hashable (e.g. vertex arrays) are built without caching.
+
+    Args:
+        marker (MarkerType): Resolved marker spec (LINE_MAP already applied).
+        properties (MarkerProperties): Style settings to apply.
+
+    Returns:
+        MarkerStyle: Marker style for Line2D.set_marker().
+    """
+    try:
+        hash(marker)
+    except TypeError:
+        return MarkerStyle(
+            marker=marker,
+            fillstyle=properties.fill_style,
+            transform=_make_transform(
+                properties.rotation, properties.x_offset, properties.y_offset
+            ),
+            capstyle=properties.cap_style,
+        )
+    return _cached_marker_style(
+        marker,
+        properties.fill_style,
+        properties.cap_style,
+        properties.rotation,
+        properties.x_offset,
+        properties.y_offset,
+    )
+
+
+# axis -> (ticks position at resolve time, resolved settings)
+_RESOLVE_CACHE: WeakKeyDictionary[Axis, tuple[str, MarkerSettings]] = (
+    WeakKeyDictionary()
+)
+
+
+class MarkerResolver:
+    """Resolve which tick markers are active and their default marker types."""
 
     def __init__(self, axis: Axis) -> None:
         """
@@ -78,6 +197,9 @@ class MarkerResolver:
             axis (Axis): Matplotlib axis (XAxis or YAxis) to inspect.
         """
         self.axis = axis
+        self._kind: Literal["x", "y"] | None = (
+            "x" if isinstance(axis, XAxis) else "y" if isinstance(axis, YAxis) else None
+        )
 
     def get_active_position(self) -> tuple[bool, bool]:
         """Determine which tick sides are active based on axis type.
@@ -85,15 +207,11 @@ class MarkerResolver:
         Returns:
             tuple[bool, bool]: (tick1_active, tick2_active).
         """
-        if isinstance(self.axis, XAxis):
-            position_map = self._XAXIS_POSITION_MAP
-        elif isinstance(self.axis, YAxis):
-            position_map = self._YAXIS_POSITION_MAP
-        else:
+        if self._kind is None:
             return True, True
 
         position = self.axis.get_ticks_position()
-        return position_map.get(position, (True, False))
+        return _POSITION_TABLE.get((self._kind, position), (True, False))
 
     def get_default_marker(self) -> tuple[MarkerType, MarkerType]:
         """Return the default tick1 and tick2 markers for the axis type.
@@ -101,90 +219,311 @@ class MarkerResolver:
         Returns:
             tuple[MarkerType, MarkerType]: (tick1_marker, tick2_marker).
         """
-        if isinstance(self.axis, YAxis):
-            return "line_left", "line_right"
-        if isinstance(self.axis, XAxis):
-            return "line_down", "line_up"
-        return "line_left", "line_right"
+        return _DEFAULT_MARKERS.get(self._kind, ("line_left", "line_right"))
 
     def resolve(self) -> MarkerSettings:
         """Resolve the full marker settings for the current axis.
 
+        Results are cached per axis and reused while its ticks position
+        is unchanged.
+
         Returns:
             MarkerSettings: Resolved activation and default markers.
         """
+        position = self.axis.get_ticks_position()
+        cached = _RESOLVE_CACHE.get(self.axis)
+        if cached is not None and cached[0] == position:
+            return cached[1]
+
         tick1_active, tick2_active = self.get_active_position()
         tick1_marker, tick2_marker = self.get_default_marker()
-        return MarkerSettings(
+        settings = MarkerSettings(
             tick1_active=tick1_active,
             tick2_active=tick2_active,
             tick1_marker=tick1_marker,
             tick2_marker=tick2_marker,
         )
-
-
-class MarkerStyler:
-    """Apply marker styling to a single tick Line2D artist."""
+        _RESOLVE_CACHE[self.axis] = (position, settings)
+        return settings
+
+
+def _style_tick_lines(
+    lines: list[Line2D],
+    marker_style: MarkerStyle,
+    face_color: str | None,
+    border_color: str | None,
+    border_width: float | None,
+    size: float | None,
+) -> None:
+    """Apply marker styling to a group of visible tick Line2D artists.
+
+    Callers pass only visible lines. Properties are applied to the whole
+    group with a single artist.setp call.
+
+    Args:
+        lines (list[Line2D]): Tick line artists of one tick side.
+        marker_style (MarkerStyle): Prebuilt marker style shared by all tick
+            lines on the same side.
+        face_color (str | None): Optional marker fill color.
+        border_color (str | None): Optional marker edge color.
+        border_width (float | None): Optional marker edge width.
+        size (float | None): Optional marker size.
+    """
+    if not lines:
+        return
+
+    properties: dict[str, str | float | MarkerStyle] = {}
+    if face_color is not None:
+        properties["markerfacecolor"] = face_color
+    if border_color is not None:
+        properties["markeredgecolor"] = border_color
+    if border_width is not None:
+        properties["markeredgewidth"] = border_width
+    if size is not None:
+        properties["markersize"] = size
+    properties["marker"] = marker_style
+    artist.setp(lines, **properties)
+
+
+class BatchedMarkerArtist(Artist):
+    """Draw the markers of one tick side at the current tick locations.
+
+    The markers are rendered by an internal marker-only Line2D. The artist
+    itself is not a Line2D, so it stays out of ax.lines and line stylers do
+    not pick it up. Tick locations depend on the view limits, which may
+    change between the styling call and rendering (autoscaling, zooming,
+    panning), so they are queried from the axis locator at draw time, as
+    per-tick lines do. Style properties left unset follow the side's tick
+    line, so later tick_params() colors, length and width still apply.
+    """
 
     def __init__(
         self,
-        line: Line2D,
-        marker: MarkerType,
+        batcher: "MarkerBatcher",
+        which: Literal["major", "minor"],
+        side: int,
         properties: MarkerProperties,
     ) -> None:
         """
         Args:
-            line (Line2D): Tick line artist to style.
-            marker (MarkerType): Marker spec to apply for this tick line.
-            properties (MarkerProperties): Style settings to apply.
+            batcher (MarkerBatcher): Batcher that owns placement logic.
+            which (Literal["major", "minor"]): Tick group the artist draws.
+            side (int): Tick side, 1 for tick1line and 2 for tick2line.
+            properties (MarkerProperties): Style settings applied to the
+                markers.
         """
-        self.line = line
+        super().__init__()
+        self.batcher = batcher
+        self.which = which
+        self.side = side
         self.properties = properties
-        self.marker = marker
-
-    def set_color(self) -> None:
-        """Apply face and edge colors to the marker."""
-        if self.properties.face_color is not None:
-            self.line.set_markerfacecolor(self.properties.face_color)
-        if self.properties.border_color is not None:
-            self.line.set_markeredgecolor(self.properties.border_color)
-
-    def set_dimension(self) -> None:
-        """Apply edge width and marker size."""
-        if self.properties.border_width is not None:
-            self.line.set_markeredgewidth(self.properties.border_width)
-        if self.properties.size is not None:
-            self.line.set_markersize(self.properties.size)
-
-    def set_marker(self) -> None:
-        """Apply marker geometry with rotation and translation transforms."""
-        resolved_marker = (
-            LINE_MAP[self.marker]
-            if isinstance(self.marker, str) and self.marker in LINE_MAP
-            else self.marker
+        self.line = Line2D([], [])
+
+    def get_tick_line(self) -> Line2D:
+        """Return the tick line of the first tick on this artist's side.
+
+        Returns:
+            Line2D: Tick line whose style the unset properties follow.
+        """
+        axis = self.batcher.axis
+        ticks = axis.majorTicks if self.which == "major" else axis.minorTicks
+        return ticks[0].tick1line if self.side == 1 else ticks[0].tick2line
+
+    def sync(self) -> None:
+        """Copy the tick line style for every property left unset."""
+        tick_line = self.get_tick_line()
+        if self.properties.face_color is None:
+            self.line.set_markerfacecolor(tick_line.get_markerfacecolor())
+        if self.properties.border_color is None:
+            self.line.set_markeredgecolor(tick_line.get_markeredgecolor())
+        if self.properties.border_width is None:
+            self.line.set_markeredgewidth(tick_line.get_markeredgewidth())
+        if self.properties.size is None:
+            self.line.set_markersize(tick_line.get_markersize())
+
+    def get_window_extent(self, renderer=None):
+        """Return the extent of the markers, as placed by the last draw."""
+        return self.line.get_window_extent(renderer)
+
+    def draw(self, renderer) -> None:
+        """Refresh marker positions and unset styles, then draw."""
+        if not self.get_visible():
+            return
+        axis = self.batcher.axis
+        locs = (
+            axis.get_majorticklocs()
+            if self.which == "major"
+            else axis.get_minorticklocs()
         )
-        transform = (
-            Affine2D()
-            .rotate_deg(self.properties.rotation)
-            .translate(self.properties.x_offset, self.properties.y_offset)
-        )
-        self.line.set_marker(
-            MarkerStyle(
-                marker=resolved_marker,
-                fillstyle=self.properties.fill_style,
-                transform=transform,
-                capstyle=self.properties.cap_style,
-            )
+        self.sync()
+        self.batcher.place(
+            line=self.line,
+            side=self.side,
+            positions=self.batcher.get_positions(locs),
         )
+        self.line.draw(renderer)
+        self.stale = False
+
+
+# axis -> {(tick group, tick side): batched marker artist}. Batched artists
+# hold their axes, so they are referenced weakly to let the axis be collected.
+_BATCHED_MARKERS: WeakKeyDictionary[
+    Axis, WeakValueDictionary[tuple[str, int], BatchedMarkerArtist]
+] = WeakKeyDictionary()
+
+
+class MarkerBatcher:
+    """Draw all tick markers of one tick side as a single artist.
+
+    Per-tick Line2D artists are hidden and replaced by one batched marker
+    artist per active side, so a shared style is applied once and rendered
+    with a single marker draw call instead of one per tick.
+    """
+
+    def __init__(self, axis: Axis, settings: MarkerSettings) -> None:
+        """
+        Args:
+            axis (Axis): Matplotlib axis (XAxis or YAxis) to modify.
+            settings (MarkerSettings): Resolved tick-side activation and
+                default markers.
+        """
+        self.axis = axis
+        self.settings = settings
+
+    def get_positions(self, locs: Sequence[float]) -> list[float]:
+        """Keep only tick locations that fall inside the current view interval.
+
+        Args:
+            locs (Sequence[float]): Tick locations produced by the locator.
+
+        Returns:
+            list[float]: Locations that Matplotlib would draw ticks for.
+        """
+        low, high = sorted(self.axis.get_view_interval())
+        tolerance = 1e-10 * (high - low)
+        return [loc for loc in locs if low - tolerance <= loc <= high + tolerance]
+
+    def place(self, line: Line2D, side: int, positions: list[float]) -> None:
+        """Position a batched marker line along the tick side of the axis.
+
+        Args:
+            line (Line2D): Batched marker line to position.
+            side (int): Tick side, 1 for tick1line and 2 for tick2line.
+            positions (list[float]): Tick locations in data coordinates.
+        """
+        axes = self.axis.axes
+        offsets = [float(side - 1)] * len(positions)
+        if isinstance(self.axis, YAxis):
+            line.set_data(offsets, positions)
+            line.set_transform(axes.get_yaxis_transform(which=f"tick{side}"))
+        else:
+            line.set_data(positions, offsets)
+            line.set_transform(axes.get_xaxis_transform(which=f"tick{side}"))
 
-    def style(self) -> None:
-        """Apply the full style to the tick marker if the line is visible."""
-        if not self.line.get_visible():
+    def clear(self, which: Literal["major", "minor"]) -> None:
+        """Remove the batched markers of a tick group and restore its ticks.
+
+        Tick lines hidden by draw() are shown again, unless their batch was
+        hidden through enable(False).
+
+        Args:
+            which (Literal["major", "minor"]): Tick group to restore.
+        """
+        batched = _BATCHED_MARKERS.get(self.axis)
+        if not batched:
             return
 
-        self.set_color()
-        self.set_dimension()
-        self.set_marker()
+        params: dict[str, bool] = {}
+        for side in (1, 2):
+            batch = batched.pop((which, side), None)
+            if batch is not None:
+                batch.remove()
+                params[f"tick{side}On"] = batch.get_visible()
+        if params:
+            self.axis.set_tick_params(which=which, **params)
+
+    def draw(
+        self,
+        which: Literal["major", "minor"],
+        ticks: list[Tick],
+        locs: Sequence[float],
+        marker: MarkerType | None,
+        properties: MarkerProperties,
+    ) -> None:
+        """Replace the per-tick marker lines with batched marker artists.
+
+        Args:
+            which (Literal["major", "minor"]): Tick group being drawn.
+            ticks (list[Tick]): Ticks whose marker lines will be hidden.
+            locs (Sequence[float]): Tick locations produced by the locator.
+            marker (MarkerType | None): Optional marker override.
+            properties (MarkerProperties): Style settings to apply.
+
+        Notes:
+            Batched artists re-read the tick locations on every render, so
+            they follow later limit and locator changes. Sides whose tick
+            lines are hidden are left untouched.
+        """
+        batched = _BATCHED_MARKERS.setdefault(self.axis, WeakValueDictionary())
+        positions = self.get_positions(locs)
+        sides = ((1, self.settings.tick1_marker), (2, self.settings.tick2_marker))
+
+        for side, default_marker in sides:
+            previous = batched.pop((which, side), None)
+            if previous is not None:
+                previous.remove()
+            if not ticks:
+                continue
+
+            tick_lines = [
+                tick.tick1line if side == 1 else tick.tick2line for tick in ticks
+            ]
+            if previous is None and not tick_lines[0].get_visible():
+                continue
+
+            # Explicit styles accumulate across calls, as on per-tick lines.
+            batch_properties = properties
+            if previous is not None:
+                kept = previous.properties
+                batch_properties = replace(
+                    properties,
+                    face_color=_first_set(properties.face_color, kept.face_color),
+                    border_color=_first_set(properties.border_color, kept.border_color),
+                    border_width=_first_set(properties.border_width, kept.border_width),
+                    size=_first_set(properties.size, kept.size),
+                )
+            batch = BatchedMarkerArtist(
+                batcher=self, which=which, side=side, properties=batch_properties
+            )
+            line = batch.line
+            line.update_from(previous.line if previous is not None else tick_lines[0])
+            marker_style = _get_marker_style(
+                _resolve_marker(marker if marker is not None else default_marker),
+                properties,
+            )
+            _style_tick_lines(
+                [line],
+                marker_style,
+                properties.face_color,
+                properties.border_color,
+                properties.border_width,
+                properties.size,
+            )
+            self.place(line=line, side=side, positions=positions)
+            line.set_linestyle("None")
+            line.set_clip_on(False)
+            line.set_visible(True)
+            line.set_figure(self.axis.axes.get_figure(root=False))
+            # A batch hidden through enable(False) stays hidden when restyled.
+            batch.set_visible(previous is None or previous.get_visible())
+            batch.set_clip_on(False)
+            batch.set_label("_nolegend_")
+            batch.set_zorder(self.axis.get_zorder())
+            self.axis.axes.add_artist(batch)
+
+            for tick_line in tick_lines:
+                tick_line.set_visible(False)
+            batched[(which, side)] = batch
 
 
 class MajorMarkerDrawer:
@@ -208,12 +547,27 @@ class MajorMarkerDrawer:
         Returns:
             MajorMarkerDrawer: The current instance for method chaining.
         """
-        ticks = self.axis.get_major_ticks()
-        for tick in ticks:
-            if self._resolver.tick1_active:
-                tick.tick1line.set_visible(show)
-            if self._resolver.tick2_active:
-                tick.tick2line.set_visible(show)
+        if isinstance(self.axis.get_major_locator(), NullLocator):
+            return self
+        if not (self._resolver.tick1_active or self._resolver.tick2_active):
+            return self
+
+        # Tick params update the existing ticks and the template used for new
+        # ones, without materializing the lazy tick list. Batched sides keep
+        # their tick lines hidden and toggle the batched artist instead.
+        batched = _BATCHED_MARKERS.get(self.axis, {})
+        active = ((1, self._resolver.tick1_active), (2, self._resolver.tick2_active))
+        params: dict[str, bool] = {}
+        for side, is_active in active:
+            if not is_active:
+                continue
+            batch = batched.get(("major", side))
+            if batch is not None:
+                batch.set_visible(show)
+            else:
+                params[f"tick{side}On"] = show
+        if params:
+            self.axis.set_tick_params(which="major", **params)
         return self
 
     def draw(
@@ -229,6 +583,7 @@ class MajorMarkerDrawer:
         y_offset: float = 0,
         rotation: float = 0,
         step: int | None = None,
+        use_collection: bool = False,
     ) -> "MajorMarkerDrawer":
         """Apply styling to major tick markers.
 
@@ -249,6 +604,8 @@ class MajorMarkerDrawer:
             rotation (float): Marker rotation in degrees.
             step (int | None): Optional interval for major ticks based on axis
                 values. When provided, sets MultipleLocator(step).
+            use_collection (bool): Whether to draw the markers of each tick
+                side as one batched artist instead of styling every tick line.
 
         Returns:
             MajorMarkerDrawer: The current instance for method chaining.
@@ -257,10 +614,9 @@ class MajorMarkerDrawer:
             ValueError: If the computed tick count exceeds 30 when step is set.
         """
         if step is not None:
-            view_min, view_max = self.axis.get_view_interval()
-            ticks = MultipleLocator(step).tick_values(view_min, view_max)
-            if len(ticks) > 30:
-                raise ValueError(f"Tick count:({len(ticks)}), increase step size.")
+            count = _multiple_tick_count(*self.axis.get_view_interval(), step)
+            if count > 30:
+                raise ValueError(f"Tick count:({count}), increase step size.")
             self.axis.set_major_locator(MultipleLocator(step))
 
         properties = MarkerProperties(
@@ -276,21 +632,49 @@ class MajorMarkerDrawer:
             rotation=rotation,
         )
 
+        batcher = MarkerBatcher(axis=self.axis, settings=self._resolver)
+        if use_collection:
+            batcher.draw(
+                which="major",
+                ticks=self.axis.get_major_ticks(),
+                locs=self.axis.get_majorticklocs(),
+                marker=marker,
+                properties=properties,
+            )
+            return self
+
+        # Switching back from the batched path: show the tick lines again so
+        # they receive the new style.
+        batcher.clear("major")
         ticks = self.axis.get_major_ticks()
-        for tick in ticks:
-            tick1_marker = marker if marker is not None else self._resolver.tick1_marker
-            tick2_marker = marker if marker is not None else self._resolver.tick2_marker
 
-            MarkerStyler(
-                line=tick.tick1line,
-                properties=properties,
-                marker=tick1_marker,
-            ).style()
-            MarkerStyler(
-                line=tick.tick2line,
-                properties=properties,
-                marker=tick2_marker,
-            ).style()
+        tick1_marker = _resolve_marker(
+            marker if marker is not None else self._resolver.tick1_marker
+        )
+        tick2_marker = _resolve_marker(
+            marker if marker is not None else self._resolver.tick2_marker
+        )
+        tick1_style = _get_marker_style(tick1_marker, properties)
+        tick2_style = _get_marker_style(tick2_marker, properties)
+
+        lines1 = [tick.tick1line for tick in ticks]
+        lines2 = [tick.tick2line for tick in ticks]
+        _style_tick_lines(
+            [line for line in lines1 if line.get_visible()],
+            tick1_style,
+            face_color,
+            border_color,
+            border_width,
+            size,
+        )
+        _style_tick_lines(
+            [line for line in lines2 if line.get_visible()],
+            tick2_style,
+            face_color,
+            border_color,
+            border_width,
+            size,
+        )
 
         return self
 
@@ -306,6 +690,7 @@ class MinorMarkerDrawer:
         self.axis = axis
         self._resolver = MarkerResolver(axis).resolve()
         self._show = True
+        self._step: int | None = None
 
     def enable(self, show: bool = True) -> "MinorMarkerDrawer":
         """Enable or disable visibility of minor tick markers.
@@ -318,11 +703,13 @@ class MinorMarkerDrawer:
             MinorMarkerDrawer: The current instance for method chaining.
         """
         if not show:
-            self.axis.set_minor_locator(NullLocator())
+            if not isinstance(self.axis.get_minor_locator(), NullLocator):
+                self.axis.set_minor_locator(NullLocator())
         else:
             self.axis.set_minor_locator(AutoMinorLocator(6))
 
         self._show = show
+        self._step = 5 if show else None
         return self
 
     def draw(
@@ -338,6 +725,7 @@ class MinorMarkerDrawer:
         y_offset: float = 0,
         rotation: float = 0,
         step: int = 5,
+        use_collection: bool = False,
     ) -> "MinorMarkerDrawer":
         """Apply styling to minor tick markers.
 
@@ -358,12 +746,18 @@ class MinorMarkerDrawer:
             rotation (float): Marker rotation in degrees.
             step (int): Number of subdivisions between major ticks.
                 Used as AutoMinorLocator(step + 1).
+            use_collection (bool): Whether to draw the markers of each tick
+                side as one batched artist instead of styling every tick line.
 
         Returns:
             MinorMarkerDrawer: The current instance for method chaining.
         """
-        if self._show:
+        if not self._show:
+            return self
+
+        if step != self._step:
             self.axis.set_minor_locator(AutoMinorLocator(step + 1))
+            self._step = step
 
         properties = MarkerProperties(
             border_color=border_color,
@@ -378,20 +772,48 @@ class MinorMarkerDrawer:
             rotation=rotation,
         )
 
+        batcher = MarkerBatcher(axis=self.axis, settings=self._resolver)
+        if use_collection:
+            batcher.draw(
+                which="minor",
+                ticks=self.axis.get_minor_ticks(),
+                locs=self.axis.get_minorticklocs(),
+                marker=marker,
+                properties=properties,
+            )
+            return self
+
+        # Switching back from the batched path: show the tick lines again so
+        # they receive the new style.
+        batcher.clear("minor")
         ticks = self.axis.get_minor_ticks()
-        for tick in ticks:
-            tick1_marker = marker if marker is not None else self._resolver.tick1_marker
-            tick2_marker = marker if marker is not None else self._resolver.tick2_marker
 
-            MarkerStyler(
-                line=tick.tick1line,
-                properties=properties,
-                marker=tick1_marker,
-            ).style()
-            MarkerStyler(
-                line=tick.tick2line,
-                properties=properties,
-                marker=tick2_marker,
-            ).style()
+        tick1_marker = _resolve_marker(
+            marker if marker is not None else self._resolver.tick1_marker
+        )
+        tick2_marker = _resolve_marker(
+            marker if marker is not None else self._resolver.tick2_marker
+        )
+        tick1_style = _get_marker_style(tick1_marker, properties)
+        tick2_style = _get_marker_style(tick2_marker, properties)
+
+        lines1 = [tick.tick1line for tick in ticks]
+        lines2 = [tick.tick2line for tick in ticks]
+        _style_tick_lines(
+            [line for line in lines1 if line.get_visible()],
+            tick1_style,
+            face_color,
+            border_color,
+            border_width,
+            size,
+        )
+        _style_tick_lines(
+            [line for line in lines2 if line.get_visible()],
+            tick2_style,
+            face_color,
+            border_color,
+            border_width,
+            size,
+        )
 
         return self
@@ -1,6 +1,7 @@
 """Provide a unified facade for styling Matplotlib axes."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from matplotlib.axes import Axes
 
@@ -19,7 +20,7 @@ class AxisStyler:
 
     ax: Axes
 
-    @property
+    @cached_property
     def label(self) -> AxisLabel:
         """Access axis label styling helpers.
 
@@ -28,7 +29,7 @@ class AxisStyler:
         """
         return AxisLabel(ax=self.ax)
 
-    @property
+    @cached_property
     def margin(self) -> AxisMargin:
         """Access axis margin styling helper.
 
@@ -37,7 +38,7 @@ class AxisStyler:
         """
         return AxisMargin(ax=self.ax)
 
-    @property
+    @cached_property
     def range(self) -> AxisRange:
         """Access axis range (limits) styling helpers.
 
@@ -46,7 +47,7 @@ class AxisStyler:
         """
         return AxisRange(ax=self.ax)
 
-    @property
+    @cached_property
     def spine(self) -> AxisSpine:
         """Access axis spine styling helper.
 
@@ -55,7 +56,7 @@ class AxisStyler:
         """
         return AxisSpine(ax=self.ax)
 
-    @property
+    @cached_property
     def tick(self) -> AxisTick:
         """Access axis tick styling helpers.
 
@@ -2,6 +2,7 @@
 
 from typing import Callable
 
+from matplotlib import artist
 from matplotlib.axis import Tick
 
 
@@ -40,20 +41,14 @@ class GridDrawer:
         Returns:
             None: Grid line objects are modified in place.
         """
-        grid_lines = [tick.gridline for tick in self.tick_getter()]
-
-        for line in grid_lines:
-            if show:
-                line.set_visible(show)
-
-            if color is not None:
-                line.set_color(color)
-
-            if style is not None:
-                line.set_linestyle(style)
-
-            if width is not None:
-                line.set_linewidth(width)
-
-            if alpha is not None:
-                line.set_alpha(alpha)
+        properties: dict[str, bool | str | float] = {"visible": show}
+        if color is not None:
+            properties["color"] = color
+        if style is not None:
+            properties["linestyle"] = style
+        if width is not None:
+            properties["linewidth"] = width
+        if alpha is not None:
+            properties["alpha"] = alpha
+
+        artist.setp([tick.gridline for tick in self.tick_getter()], **properties)
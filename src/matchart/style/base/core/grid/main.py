@@ -1,6 +1,7 @@
 """Provide accessors for styling major/minor grid lines on x/y axes."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from matplotlib.axes import Axes
 from matplotlib.axis import Axis
@@ -19,7 +20,7 @@ class GridSelector:
 
     axis: Axis
 
-    @property
+    @cached_property
     def major(self) -> GridDrawer:
         """Return the major grid drawer.
 
@@ -28,7 +29,7 @@ class GridSelector:
         """
         return GridDrawer(tick_getter=self.axis.get_major_ticks)
 
-    @property
+    @cached_property
     def minor(self) -> GridDrawer:
         """Return the minor grid drawer.
 
@@ -52,7 +53,7 @@ class GridStyler:
         """Configure the axes so grids render beneath plot artists."""
         self.ax.set_axisbelow(True)
 
-    @property
+    @cached_property
     def x(self) -> GridSelector:
         """Return grid selector for the x-axis.
 
@@ -61,7 +62,7 @@ class GridStyler:
         """
         return GridSelector(axis=self.ax.xaxis)
 
-    @property
+    @cached_property
     def y(self) -> GridSelector:
         """Return grid selector for the y-axis.
 
@@ -0,0 +1,31 @@
+"""Build shared legend font properties."""
+
+from functools import lru_cache
+
+from matplotlib.font_manager import FontProperties
+
+
+@lru_cache(maxsize=256)
+def get_font_properties(
+    family: str | None = None,
+    fname: str | None = None,
+    size: int | None = None,
+) -> FontProperties:
+    """Return FontProperties for a family name or font file, built once.
+
+    FontProperties is mutable; callers that hand the result to an object
+    keeping a reference (e.g. Legend(prop=...)) should pass a copy. Text
+    setters copy on their own.
+
+    Args:
+        family (str | None): Font family name (e.g., "DejaVu Sans").
+        fname (str | None): Path to a font file. Takes precedence over
+            `family` when provided.
+        size (int | None): Font size in points.
+
+    Returns:
+        FontProperties: Cached font properties for the given arguments.
+    """
+    if fname is not None:
+        return FontProperties(fname=fname, size=size)
+    return FontProperties(family=family, size=size)
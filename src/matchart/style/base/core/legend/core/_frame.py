@@ -1,13 +1,19 @@
 """Style legend frame."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from matplotlib.colors import to_rgba
-from matplotlib.legend import Legend
 from matplotlib.patches import FancyBboxPatch, Rectangle
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _to_rgba_cached(color: str) -> tuple[float, float, float, float]:
+    """Return `to_rgba(color)`, memoized for repeated theme colors."""
+    return to_rgba(color)
+
+
+@dataclass(frozen=True, slots=True)
 class FrameProperties:
     """Store styling properties for a legend frame.
 
@@ -41,54 +47,47 @@ class FrameStyler:
         """
         self.frame = frame
 
-    def set_face_color(self, color: str | None) -> None:
-        """Set the background color of the legend frame.
+    def set_face(self, color: str | None, alpha: float | None) -> None:
+        """Set the background color and alpha of the legend frame.
+
+        Assumes the patch-level alpha has been reset (see style()).
 
         Args:
             color (str | None): Matplotlib-compatible color string.
+            alpha (float | None): Alpha override in [0, 1].
         """
-        # Reset global alpha so per-channel RGBA values are respected.
-        self.frame.set_alpha(None)
+        if color is None and alpha is None:
+            return
 
         if color is not None:
-            r, g, b, a = to_rgba(color)
-            self.frame.set_facecolor((r, g, b, a))
-
-    def set_face_alpha(self, alpha: float | None) -> None:
-        """Override the alpha channel of the legend frame background.
-
-        Args:
-            alpha (float | None): Alpha value in [0, 1].
-        """
-        self.frame.set_alpha(None)
+            r, g, b, a = (
+                _to_rgba_cached(color) if isinstance(color, str) else to_rgba(color)
+            )
+        else:
+            # Patch colors are stored as RGBA tuples already.
+            r, g, b, a = self.frame.get_facecolor()
+        self.frame.set_facecolor((r, g, b, a if alpha is None else alpha))
 
-        if alpha is not None:
-            r, g, b, _ = to_rgba(self.frame.get_facecolor())
-            self.frame.set_facecolor((r, g, b, alpha))
+    def set_border(self, color: str | None, alpha: float | None) -> None:
+        """Set the border color and alpha of the legend frame.
 
-    def set_border_color(self, color: str | None) -> None:
-        """Set the border color of the legend frame.
+        Assumes the patch-level alpha has been reset (see style()).
 
         Args:
             color (str | None): Matplotlib-compatible color string.
+            alpha (float | None): Alpha override in [0, 1].
         """
-        self.frame.set_alpha(None)
+        if color is None and alpha is None:
+            return
 
         if color is not None:
-            r, g, b, a = to_rgba(color)
-            self.frame.set_edgecolor((r, g, b, a))
-
-    def set_border_alpha(self, alpha: float | None) -> None:
-        """Override the alpha channel of the legend frame border.
-
-        Args:
-            alpha (float | None): Alpha value in [0, 1].
-        """
-        self.frame.set_alpha(None)
-
-        if alpha is not None:
-            r, g, b, _ = to_rgba(self.frame.get_edgecolor())
-            self.frame.set_edgecolor((r, g, b, alpha))
+            r, g, b, a = (
+                _to_rgba_cached(color) if isinstance(color, str) else to_rgba(color)
+            )
+        else:
+            # Patch colors are stored as RGBA tuples already.
+            r, g, b, a = self.frame.get_edgecolor()
+        self.frame.set_edgecolor((r, g, b, a if alpha is None else alpha))
 
     def set_border_style(self, style: str | None) -> None:
         """Set the border line style.
@@ -127,33 +126,11 @@ class FrameStyler:
         Returns:
             None: The legend frame patch is modified in place.
         """
-        self.set_face_color(color=properties.face_color)
-        self.set_face_alpha(alpha=properties.face_alpha)
-        self.set_border_color(color=properties.border_color)
-        self.set_border_alpha(alpha=properties.border_alpha)
+        # Reset global alpha once so per-channel RGBA values are respected.
+        self.frame.set_alpha(None)
+
+        self.set_face(color=properties.face_color, alpha=properties.face_alpha)
+        self.set_border(color=properties.border_color, alpha=properties.border_alpha)
         self.set_border_style(style=properties.border_style)
         self.set_border_width(width=properties.border_width)
         self.set_border_radius(radius=properties.border_radius)
-
-
-class FrameDrawer:
-    """Fetch and style a legend frame from a Legend object."""
-
-    def __init__(self, legend: Legend) -> None:
-        """
-        Args:
-            legend (Legend): Matplotlib legend whose frame will be styled.
-        """
-        self.legend = legend
-
-    def draw(self, properties: FrameProperties) -> None:
-        """Draw and style the legend frame.
-
-        Args:
-            properties (FrameProperties): Frame styling configuration.
-
-        Returns:
-            None: The legend frame patch is modified in place.
-        """
-        frame = self.legend.get_frame()
-        FrameStyler(frame=frame).style(properties=properties)
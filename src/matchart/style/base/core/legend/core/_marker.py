@@ -1,6 +1,8 @@
 """Style legend marker."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from matplotlib.artist import Artist
 from matplotlib.container import BarContainer
@@ -8,7 +10,27 @@ from matplotlib.lines import Line2D
 from matplotlib.typing import ColorType
 
 
-@dataclass
+def _bar_color(handle: BarContainer) -> ColorType | None:
+    """Return the face color of the first bar in a container, if any."""
+    try:
+        return handle.patches[0].get_facecolor()
+    except IndexError:
+        return None
+
+
+def _no_color(handle: Artist) -> ColorType | None:
+    """Return None for handle types without a representative color."""
+    return None
+
+
+# handle type -> color getter; subclasses are added on first lookup.
+_COLOR_GETTERS: dict[type, Callable[[Any], ColorType | None]] = {
+    BarContainer: _bar_color,
+    Line2D: Line2D.get_color,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class MarkerProperties:
     """Store properties used to construct custom legend marker handles.
 
@@ -22,6 +44,10 @@ class MarkerProperties:
     marker: str | None
     size: float | None
 
+    def __bool__(self) -> bool:
+        """Return True if a marker glyph or size is configured."""
+        return self.marker is not None or self.size is not None
+
 
 class MarkerStyler:
     """Convert plot handles into styled Line2D marker handles."""
@@ -44,13 +70,20 @@ class MarkerStyler:
             ColorType | None: Color value to use for markerfacecolor, or
             None when the handle type is unsupported.
         """
-        if isinstance(handle, BarContainer) and handle.patches:
-            return handle.patches[0].get_facecolor()
-
-        if isinstance(handle, Line2D):
-            return handle.get_color()
-
-        return None
+        handle_type = type(handle)
+        getter = _COLOR_GETTERS.get(handle_type)
+        if getter is None:
+            # Subclasses resolve through their MRO once, then hit the table.
+            getter = next(
+                (
+                    _COLOR_GETTERS[cls]
+                    for cls in handle_type.__mro__
+                    if cls in _COLOR_GETTERS
+                ),
+                _no_color,
+            )
+            _COLOR_GETTERS[handle_type] = getter
+        return getter(handle)
 
     def style(self, properties: MarkerProperties) -> list[Line2D]:
         """Create styled Line2D marker handles from the input handles.
@@ -60,18 +93,22 @@ class MarkerStyler:
 
         Returns:
             list[Line2D]: New legend handles suitable for passing to
-            ax.legend(handles=...).
+            ax.legend(handles=...), or an empty list when neither a marker
+            nor a size is set.
         """
+        # No glyph or size requested: let the legend keep its default handles.
+        if properties.marker is None and properties.size is None:
+            return []
+
+        shared = {
+            "marker": properties.marker,
+            "color": "none",
+            "markeredgecolor": "none",
+            "markersize": properties.size,
+        }
+        get_color = self.get_color
         return [
-            Line2D(
-                [],
-                [],
-                marker=properties.marker,
-                color="none",
-                markerfacecolor=self.get_color(handle),
-                markeredgecolor="none",
-                markersize=properties.size,
-            )
+            Line2D([], [], markerfacecolor=get_color(handle), **shared)
             for handle in self.handles
         ]
 
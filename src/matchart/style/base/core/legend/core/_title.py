@@ -3,11 +3,12 @@
 from dataclasses import dataclass
 
 from matplotlib.font_manager import FontProperties
-from matplotlib.legend import Legend
 from matplotlib.text import Text
 
+from ._font import get_font_properties
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TitleProperties:
     """Store styling properties for a legend title.
 
@@ -35,33 +36,6 @@ class TitleStyler:
         """
         self.title = title
 
-    def set_font(self, font: FontProperties | str | None) -> None:
-        """Set the font of the legend title.
-
-        Args:
-            font (FontProperties | str | None): Font configuration to apply.
-        """
-        if font is not None:
-            self.title.set_fontproperties(font)
-
-    def set_size(self, size: int | None) -> None:
-        """Set the font size of the legend title.
-
-        Args:
-            size (int | None): Font size in points.
-        """
-        if size is not None:
-            self.title.set_fontsize(size)
-
-    def set_color(self, color: str | None) -> None:
-        """Set the color of the legend title.
-
-        Args:
-            color (str | None): Matplotlib-compatible color string.
-        """
-        if color is not None:
-            self.title.set_color(color)
-
     def style(self, properties: TitleProperties) -> None:
         """Apply title styling properties to the legend title.
 
@@ -71,29 +45,17 @@ class TitleStyler:
         Returns:
             None: The title Text artist is modified in place.
         """
-        self.set_font(properties.font)
-        self.set_size(properties.size)
-        self.set_color(properties.color)
-
-
-class TitleDrawer:
-    """Fetch and style a legend title from a Legend object."""
-
-    def __init__(self, legend: Legend) -> None:
-        """
-        Args:
-            legend (Legend): Matplotlib legend whose title will be styled.
-        """
-        self.legend = legend
-
-    def draw(self, properties: TitleProperties) -> None:
-        """Draw and style the legend title.
-
-        Args:
-            properties (TitleProperties): Title styling configuration.
-
-        Returns:
-            None: The legend title Text artist is modified in place.
-        """
-        title = self.legend.get_title()
-        TitleStyler(title=title).style(properties=properties)
+        # One Text.update() call marks the artist stale once; it applies
+        # fontproperties before the other keys, so size still wins.
+        updates: dict[str, FontProperties | str | int] = {}
+        if isinstance(properties.font, str):
+            # Same family-or-pattern parsing as Text.set_fontproperties(str).
+            updates["fontproperties"] = get_font_properties(family=properties.font)
+        elif properties.font is not None:
+            updates["fontproperties"] = properties.font
+        if properties.size is not None:
+            updates["fontsize"] = properties.size
+        if properties.color is not None:
+            updates["color"] = properties.color
+        if updates:
+            self.title.update(updates)
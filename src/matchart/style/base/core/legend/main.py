@@ -1,14 +1,26 @@
 """Style and draw Matplotlib legends."""
 
+import warnings
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 from typing import Literal
 
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
+from matplotlib.colors import to_rgba
 from matplotlib.font_manager import FontProperties
 from matplotlib.lines import Line2D
 
-from .core._frame import FrameDrawer, FrameProperties
-from .core._marker import MarkerDrawer, MarkerProperties
-from .core._title import TitleDrawer, TitleProperties
+from .core._font import get_font_properties
+from .core._frame import FrameProperties, FrameStyler
+from .core._marker import (
+    MarkerDrawer,
+    MarkerProperties,
+    MarkerStyler,
+)
+from .core._title import TitleProperties, TitleStyler
 
 type Orientation = Literal["horizontal", "vertical"]
 type Alignment = Literal["left", "center", "right"]
@@ -27,9 +39,100 @@ type Position = Literal[
 ]
 
 
+# legend position -> anchor point in axes fraction units
+_ANCHOR_MAP: Mapping[str, tuple[float, float]] = MappingProxyType(
+    {
+        "upper right": (1.0, 1.0),
+        "upper left": (0.0, 1.0),
+        "lower left": (0.0, 0.0),
+        "lower right": (1.0, 0.0),
+        "right": (1.0, 0.5),
+        "center left": (0.0, 0.5),
+        "center right": (1.0, 0.5),
+        "lower center": (0.5, 0.0),
+        "upper center": (0.5, 1.0),
+        "center": (0.5, 0.5),
+        "best": (1.0, 1.0),
+    }
+)
+
+
+# Set once the slow position="best" warning has been shown.
+_best_position_warned = False
+
+
+@lru_cache(maxsize=64)
+def _compute_anchor(
+    position: str, x_offset: float | None, y_offset: float | None
+) -> tuple[float, float] | None:
+    """Return the offset legend anchor, or None when no offset is given.
+
+    Args:
+        position (str): Legend location used to pick the base anchor.
+        x_offset (float | None): X offset in axes fraction units.
+        y_offset (float | None): Y offset in axes fraction units.
+
+    Returns:
+        tuple[float, float] | None: Anchor point in axes fraction units.
+    """
+    if x_offset is None and y_offset is None:
+        return None
+    base_x, base_y = _ANCHOR_MAP.get(position, (0.5, 0.5))
+    return base_x + (x_offset or 0.0), base_y + (y_offset or 0.0)
+
+
+def _bounds_key(ax: Axes) -> tuple[float, ...]:
+    """Return `ax`'s display bbox bounds rounded to 1e-6 pixels.
+
+    Twinned axes can differ from their host in the last float digits of
+    their bounds; rounding lets the overlay scan still match them.
+    """
+    return tuple(round(value, 6) for value in ax.bbox.bounds)
+
+
+def _overlay_axes(ax: Axes) -> list[Axes]:
+    """Return the other axes of the figure that share `ax`'s bbox.
+
+    Args:
+        ax (Axes): Axes whose overlays should be found.
+
+    Returns:
+        list[Axes]: Overlayed axes in figure order, excluding `ax`.
+    """
+    key = _bounds_key(ax)
+    return [
+        other
+        for other in ax.figure.axes
+        if other is not ax and _bounds_key(other) == key
+    ]
+
+
 class LegendStyler:
     """Configure and render a Matplotlib legend."""
 
+    __slots__ = (
+        "_align",
+        "_bbox_to_anchor",
+        "_box_pad",
+        "_custom_labels",
+        "_custom_markers",
+        "_frame_properties",
+        "_frame_show",
+        "_h_pad",
+        "_label_color",
+        "_label_font",
+        "_label_size",
+        "_marker_first",
+        "_marker_key",
+        "_marker_pad",
+        "_marker_properties",
+        "_position",
+        "_title_properties",
+        "_title_text",
+        "_v_pad",
+        "ax",
+    )
+
     def __init__(self, ax: Axes) -> None:
         """
         Args:
@@ -58,6 +161,7 @@ class LegendStyler:
         self._marker_properties: MarkerProperties | None = None
         self._custom_markers: list[Line2D] | None = None
         self._custom_labels: list[str] | None = None
+        self._marker_key: tuple | None = None
 
         # Position properties
         self._position: Position | None = "upper right"
@@ -124,9 +228,11 @@ class LegendStyler:
             LegendStyler: The current instance for method chaining.
         """
         if isinstance(font, str):
-            self._label_font = FontProperties(family=font, size=size)
+            self._label_font = get_font_properties(family=font, size=size).copy()
         if isinstance(font, FontProperties):
-            self._label_font = FontProperties(fname=str(font.get_file()), size=size)
+            self._label_font = get_font_properties(
+                fname=str(font.get_file()), size=size
+            ).copy()
 
         self._label_size = size
         self._label_color = color
@@ -194,7 +300,9 @@ class LegendStyler:
             position (Position): Legend location.
                 Options: "best", "upper right", "upper left", "lower left",
                 "lower right", "right", "center left", "center right",
-                "lower center", "upper center", "center".
+                "lower center", "upper center", "center". "best" is slow on
+                large plots (a warning is issued once per session) and is
+                pinned to "upper right" when an offset is given.
             x_offset (float | None): Optional x offset applied to the anchor
                 point when provided (in axes fraction units).
             y_offset (float | None): Optional y offset applied to the anchor
@@ -203,25 +311,23 @@ class LegendStyler:
         Returns:
             LegendStyler: The current instance for method chaining.
         """
-        _anchor_map = {
-            "upper right": (1.0, 1.0),
-            "upper left": (0.0, 1.0),
-            "lower left": (0.0, 0.0),
-            "lower right": (1.0, 0.0),
-            "right": (1.0, 0.5),
-            "center left": (0.0, 0.5),
-            "center right": (1.0, 0.5),
-            "lower center": (0.5, 0.0),
-            "upper center": (0.5, 1.0),
-            "center": (0.5, 0.5),
-        }
+        global _best_position_warned
 
         self._position = position
-        if x_offset is not None or y_offset is not None:
-            base_x, base_y = _anchor_map.get(position, (0.5, 0.5))
-            self._bbox_to_anchor = (
-                base_x + (x_offset or 0.0),
-                base_y + (y_offset or 0.0),
+        anchor = _compute_anchor(position, x_offset, y_offset)
+        if anchor is not None:
+            self._bbox_to_anchor = anchor
+            # An explicit anchor makes the "best" search redundant; pin the
+            # legend corner that matches the anchor instead.
+            if position == "best":
+                self._position = "upper right"
+        elif position == "best" and not _best_position_warned:
+            _best_position_warned = True
+            warnings.warn(
+                'position="best" searches for the least-overlapping location '
+                "on every draw, which is slow for large datasets; prefer a "
+                "fixed position.",
+                stacklevel=2,
             )
         return self
 
@@ -249,6 +355,24 @@ class LegendStyler:
         self._title_properties = TitleProperties(font=font, size=size, color=color)
         return self
 
+    def get_marker_colors(self, handles: list[Artist]) -> tuple:
+        """Return the normalized colors custom marker handles would copy.
+
+        Args:
+            handles (list[Artist]): Legend handles gathered for this draw.
+
+        Returns:
+            tuple: One RGBA tuple (or None) per handle, or an empty tuple
+            when no custom markers are configured.
+        """
+        if not self._marker_properties:
+            return ()
+        styler = MarkerStyler(handles=handles)
+        return tuple(
+            None if color is None else to_rgba(color)
+            for color in map(styler.get_color, handles)
+        )
+
     def draw(self, orientation: Orientation = "vertical") -> None:
         """Create/update the legend and apply configured styling.
 
@@ -268,46 +392,66 @@ class LegendStyler:
         Returns:
             None: The Axes legend is created/updated and styled in place.
         """
-        handles, labels = self.ax.get_legend_handles_labels()
-
         # Merge handles/labels from overlayed axes sharing the same bbox.
-        for ax in self.ax.figure.axes:
-            if ax != self.ax and (ax.bbox.bounds == self.ax.bbox.bounds):
-                handle, label = ax.get_legend_handles_labels()
-                handles.extend(handle)
-                labels.extend(label)
-
-        if self._marker_properties is not None:
-            self._custom_markers = MarkerDrawer(handles).draw(self._marker_properties)
+        pairs = [self.ax.get_legend_handles_labels()]
+        pairs.extend(ax.get_legend_handles_labels() for ax in _overlay_axes(self.ax))
+        handles = list(chain.from_iterable(pair[0] for pair in pairs))
+        labels = list(chain.from_iterable(pair[1] for pair in pairs))
+
+        if self._marker_properties:
+            # Marker handles only depend on the source handles, their colors
+            # and the marker config; rebuild them only when one changes.
+            colors = self.get_marker_colors(handles)
+            marker_key = (tuple(map(id, handles)), colors, self._marker_properties)
+            if marker_key != self._marker_key:
+                self._custom_markers = MarkerDrawer(handles).draw(
+                    self._marker_properties
+                )
+                self._marker_key = marker_key
             self._custom_labels = labels
-
-        self.ax.legend(  # type:ignore
-            handles=self._custom_markers if self._custom_markers else handles,
-            labels=self._custom_labels if self._custom_markers else labels,
-            ncol=len(labels) if orientation == "horizontal" else 1,
-            loc=self._position,
+        else:
+            self._marker_key = None
+            self._custom_markers = None
+            self._custom_labels = None
+
+        # Unset options are left out so Legend falls back to rcParams
+        # directly instead of resolving explicit None values.
+        optional = {
+            "loc": self._position,
+            "prop": self._label_font,
+            "labelcolor": self._label_color,
+            "fontsize": self._label_size,
+            "labelspacing": self._v_pad,
+            "columnspacing": self._h_pad,
+            "borderpad": self._box_pad,
+            "handletextpad": self._marker_pad,
+            "bbox_to_anchor": self._bbox_to_anchor,
+        }
+        if self._custom_markers:
+            handles, labels = self._custom_markers, self._custom_labels or labels
+        n_labels = len(labels)
+
+        legend = self.ax.legend(  # type:ignore
+            handles=handles,
+            labels=labels,
+            ncol=n_labels if orientation == "horizontal" else 1,
             markerfirst=self._marker_first,
-            prop=self._label_font,
-            labelcolor=self._label_color,
-            fontsize=self._label_size,
-            labelspacing=self._v_pad,
-            columnspacing=self._h_pad,
-            borderpad=self._box_pad,
-            handletextpad=self._marker_pad,
-            bbox_to_anchor=self._bbox_to_anchor,
             alignment=self._align,
+            **{key: value for key, value in optional.items() if value is not None},
         )
 
-        legend = self.ax.get_legend()
-
-        if legend is not None:
-            if self._frame_show is not False:
-                legend.set_frame_on(True)
-                if self._frame_properties:
-                    FrameDrawer(legend).draw(properties=self._frame_properties)
-
-        if legend is not None:
-            if self._title_text is not None:
-                legend.set_title(self._title_text)
-                if self._title_properties is not None:
-                    TitleDrawer(legend).draw(properties=self._title_properties)
+        if self._frame_show:
+            legend.set_frame_on(True)
+            # Styled even when every property is unset: style() resets the
+            # frame alpha, and each setter skips its own unset values.
+            if self._frame_properties is not None:
+                FrameStyler(frame=legend.get_frame()).style(
+                    properties=self._frame_properties
+                )
+
+        if self._title_text is not None:
+            legend.set_title(self._title_text)
+            if self._title_properties is not None:
+                TitleStyler(title=legend.get_title()).style(
+                    properties=self._title_properties
+                )
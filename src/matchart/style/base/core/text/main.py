@@ -1,6 +1,7 @@
 """Expose high-level text styling helpers."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -15,7 +16,7 @@ class TextStyler:
     ax: Axes
     fig: Figure
 
-    @property
+    @cached_property
     def title(self) -> TitleDrawer:
         """Access the Axes title styler.
 
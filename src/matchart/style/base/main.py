@@ -1,6 +1,7 @@
 """Provide a unified base styling facade for Matplotlib Axes."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -18,7 +19,7 @@ class BaseStyler:
     ax: Axes
     fig: Figure
 
-    @property
+    @cached_property
     def axis(self) -> AxisStyler:
         """Access axis-related styling helpers.
 
@@ -28,7 +29,7 @@ class BaseStyler:
         """
         return AxisStyler(ax=self.ax)
 
-    @property
+    @cached_property
     def grid(self) -> GridStyler:
         """Access grid styling helpers.
 
@@ -38,7 +39,7 @@ class BaseStyler:
         """
         return GridStyler(ax=self.ax)
 
-    @property
+    @cached_property
     def legend(self) -> LegendStyler:
         """Access legend styling helpers.
 
@@ -48,7 +49,7 @@ class BaseStyler:
         """
         return LegendStyler(ax=self.ax)
 
-    @property
+    @cached_property
     def text(self) -> TextStyler:
         """Access text styling helpers.
 
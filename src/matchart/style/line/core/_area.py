@@ -1,17 +1,22 @@
 """Style fill between area."""
 
-from typing import Any
-
+import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.collections import FillBetweenPolyCollection
-from matplotlib.colors import to_rgba
 
-from ._utils import AreaYielder, LineStyleHelper
+from ._utils import (
+    AreaYielder,
+    LineStyleHelper,
+    as_rgba,
+    resolve_style_value,
+)
 
 
 class AreaStyler:
     """Apply face (fill) styling to a single fill_between area artist."""
 
+    __slots__ = ("area",)
+
     def __init__(self, area: FillBetweenPolyCollection) -> None:
         """
         Args:
@@ -19,40 +24,40 @@ class AreaStyler:
         """
         self.area = area
 
-    def set_area_color(self, color: str | None) -> None:
-        """Set the area face color while preserving the current alpha channel.
-
-        Args:
-            color (str | None): Matplotlib-compatible color string. If None,
-                no change is applied.
-        """
-        if color is not None:
-            current_facecolor: Any = self.area.get_facecolor()
-            current_alpha = current_facecolor[0][3]
-            r, g, b, _ = to_rgba(color)
-            self.area.set_facecolor((r, g, b, current_alpha))
-
-    def set_area_alpha(self, alpha: float | None) -> None:
-        """Override the alpha channel of the area face color.
+    def set_area(self, color: str | None, alpha: float | None) -> None:
+        """Set the area face color and alpha with a single face color update.
 
         Args:
-            alpha (float | None): Alpha value in [0.0, 1.0]. If None, no change
-                is applied.
+            color (str | None): Matplotlib-compatible color string. When set,
+                replaces the RGB channels of every polygon's face color.
+            alpha (float | None): Alpha value in [0.0, 1.0]. When set, the
+                artist-level alpha is reset and every polygon's alpha channel
+                is overridden.
         """
-        # Reset global alpha so per-channel RGBA values are respected.
-        self.area.set_alpha(None)
+        if alpha is not None:
+            # Reset global alpha so per-channel RGBA values are respected.
+            self.area.set_alpha(None)
+        elif color is None:
+            return
 
+        facecolor = np.array(self.area.get_facecolor(), dtype=float)
+        if color is not None:
+            r, g, b, a = as_rgba(color)
+            if len(facecolor) == 0:
+                # No current face color (e.g. "none"): use the color as given.
+                facecolor = np.array([[r, g, b, a]])
+            else:
+                facecolor[:, :3] = (r, g, b)
         if alpha is not None:
-            facecolor: Any = self.area.get_facecolor()
-            r: float = facecolor[0][0]
-            g: float = facecolor[0][1]
-            b: float = facecolor[0][2]
-            self.area.set_facecolor((r, g, b, alpha))
+            facecolor[:, 3] = alpha
+        self.area.set_facecolor(facecolor)
 
 
 class AreaDrawer:
     """Apply face color/alpha styling across fill_between areas on an Axes."""
 
+    __slots__ = ("ax", "helper", "legend")
+
     def __init__(self, ax: Axes, legend: str | None) -> None:
         """
         Args:
@@ -97,36 +102,33 @@ class AreaDrawer:
             This method mutates FillBetweenPolyCollection artists in place and
             does not return self (not chainable).
         """
-        areas = AreaYielder(ax=self.ax)
-
-        if self.legend is not None:
-            # Area color (legend-mapped)
-            if isinstance(color, str):
-                raise TypeError("Area color must be a dictionary when legend is set.")
-            if isinstance(color, dict):
-                self.helper.validate_legend_entry(mapping=color)
-                for area, color in areas.map_legend(property=color):
-                    self._style(area=area).set_area_color(color=color)
-
-            # Area alpha (legend-mapped)
-            if isinstance(alpha, float):
-                raise TypeError("Area alpha must be a dictionary when legend is set.")
-            if isinstance(alpha, dict):
-                self.helper.validate_legend_entry(mapping=alpha)
-                for area, alpha in areas.map_legend(property=alpha):
-                    self._style(area=area).set_area_alpha(alpha=alpha)
-
-        if self.legend is None:
-            # Area color (uniform)
-            if isinstance(color, dict):
-                raise TypeError("Area color must be a string when legend is not set.")
-            if isinstance(color, str):
-                for area in areas.standard():
-                    self._style(area=area).set_area_color(color=color)
-
-            # Area alpha (uniform)
-            if isinstance(alpha, dict):
-                raise TypeError("Area alpha must be a float when legend is not set.")
-            if isinstance(alpha, float):
-                for area in areas.standard():
-                    self._style(area=area).set_area_alpha(alpha=alpha)
+        # Validate every argument before mutating any artist.
+        legend = self.legend is not None
+        color = resolve_style_value(color, str, "Area color", legend=legend)
+        alpha = resolve_style_value(alpha, float, "Area alpha", legend=legend)
+        if legend:
+            if not color and not alpha:
+                return
+            self.helper.validate_legend_entries(color, alpha)
+
+            # Collect each area's color and alpha first so every area gets
+            # a single face color update.
+            areas = AreaYielder(ax=self.ax)
+            pending: dict[FillBetweenPolyCollection, list] = {}
+            if color:
+                for area, area_color in areas.map_legend(property=color):
+                    pending.setdefault(area, [None, None])[0] = area_color
+            if alpha:
+                for area, area_alpha in areas.map_legend(property=alpha):
+                    pending.setdefault(area, [None, None])[1] = area_alpha
+
+            for area, (area_color, area_alpha) in pending.items():
+                self._style(area=area).set_area(color=area_color, alpha=area_alpha)
+            return
+
+        if color is None and alpha is None:
+            return
+
+        # Area color and alpha (uniform), applied in one pass over the areas.
+        for area in AreaYielder(ax=self.ax).standard():
+            self._style(area=area).set_area(color=color, alpha=alpha)
@@ -1,68 +1,61 @@
 """Style Line2D."""
 
+from matplotlib import artist
 from matplotlib.axes import Axes
-from matplotlib.colors import to_rgba
 from matplotlib.lines import Line2D
 
-from ._utils import LineStyleHelper, LineYielder
-
-
-class LineStyler:
-    """Apply styling to a single Line2D artist."""
-
-    def __init__(self, line: Line2D) -> None:
-        """
-        Args:
-            line (Line2D): Line artist to style.
-        """
-        self.line = line
-
-    def set_line_color(self, color: str | None) -> None:
-        """Set the line color.
-
-        Args:
-            color (str | None): Matplotlib-compatible color string. If None, no
-                change is applied.
-
-        Notes:
-            Resets the global alpha (line.set_alpha(None)) so the alpha channel
-            in the RGBA color is respected.
-        """
-        self.line.set_alpha(None)
-        if color is not None:
-            r, g, b, a = to_rgba(color)
-            self.line.set_color((r, g, b, a))
-
-    def set_line_alpha(self, alpha: float | None) -> None:
-        """Override the alpha channel of the line's current color.
-
-        Args:
-            alpha (float | None): Alpha value in [0.0, 1.0]. If None, no change
-                is applied.
-
-        Notes:
-            Resets the global alpha (line.set_alpha(None)) so the alpha channel
-            in the RGBA color is respected.
-        """
-        self.line.set_alpha(None)
-        if alpha is not None:
-            r, g, b, _ = to_rgba(self.line.get_color())
-            self.line.set_color((r, g, b, alpha))
-
-    def set_line_style(self, style: str | None) -> None:
-        """Set the line style.
-
-        Args:
-            style (str | None): Matplotlib linestyle string. If None, no change
-                is applied.
-        """
-        if style is not None:
-            self.line.set_linestyle(style)
+from ._utils import (
+    LineStyleHelper,
+    LineYielder,
+    resolve_style_value,
+    rgba_with_alpha,
+)
+
+
+def _apply_line_style(
+    line: Line2D, color: str | None, alpha: float | None, style: str | None
+) -> None:
+    """Apply the non-None line properties in color, alpha, style order.
+
+    Any color or alpha resets the global line alpha so the alpha channel of
+    the RGBA color is respected; a color given together with an alpha is
+    parsed once with the alpha folded in.
+    """
+    if color is not None or alpha is not None:
+        # Reset global alpha so the alpha channel in the RGBA color is used.
+        line.set_alpha(None)
+    if color is not None:
+        # Fold alpha into the parsed color: one set_color, no re-parse.
+        line.set_color(rgba_with_alpha(color, alpha))
+    elif alpha is not None:
+        line.set_color(rgba_with_alpha(line.get_color(), alpha))
+    if style is not None:
+        line.set_linestyle(style)
+
+
+def _uniform_line_properties(
+    color: str | None, alpha: float | None, style: str | None
+) -> dict[str, object]:
+    """Return Line2D.set() keyword arguments shared by every line.
+
+    Alpha without a color is left out: it depends on each line's own color.
+    """
+    properties: dict[str, object] = {}
+    if color is not None or alpha is not None:
+        # Reset global alpha so the alpha channel in the RGBA color is used.
+        properties["alpha"] = None
+    if color is not None:
+        properties["color"] = rgba_with_alpha(color, alpha)
+    if style is not None:
+        properties["linestyle"] = style
+    return properties
 
 
 class LineDrawer:
     """Apply styling across Line2D artists on an Axes."""
 
+    __slots__ = ("_draw", "ax", "helper", "legend")
+
     def __init__(self, ax: Axes, legend: str | None) -> None:
         """
         Args:
@@ -74,10 +67,8 @@ class LineDrawer:
         self.ax = ax
         self.legend = legend
         self.helper = LineStyleHelper(ax=self.ax)
-
-    def _style(self, line: Line2D) -> LineStyler:
-        """Create a LineStyler for a given line artist."""
-        return LineStyler(line=line)
+        # The mode is fixed for the drawer's lifetime: bind its draw once.
+        self._draw = self._draw_legend if legend is not None else self._draw_uniform
 
     def draw(
         self,
@@ -112,51 +103,45 @@ class LineDrawer:
             This method mutates Line2D artists in place and does not return self
             (not chainable).
         """
-        lines = LineYielder(ax=self.ax)
-
-        if self.legend is not None:
-            # Line color (legend-mapped)
-            if isinstance(color, str):
-                raise TypeError("Line color must be a dictionary when legend is set.")
-            if isinstance(color, dict):
-                self.helper.validate_legend_entry(mapping=color)
-                for line, color in lines.map_legend(property=color):
-                    self._style(line).set_line_color(color=color)
-
-            # Line alpha (legend-mapped)
-            if isinstance(alpha, float):
-                raise TypeError("Line alpha must be a dictionary when legend is set.")
-            if isinstance(alpha, dict):
-                self.helper.validate_legend_entry(mapping=alpha)
-                for line, alpha in lines.map_legend(property=alpha):
-                    self._style(line).set_line_alpha(alpha=alpha)
-
-            # Line style (legend-mapped)
-            if isinstance(style, str):
-                raise TypeError("Line style must be a dictionary when legend is set.")
-            if isinstance(style, dict):
-                self.helper.validate_legend_entry(mapping=style)
-                for line, style in lines.map_legend(property=style):
-                    self._style(line).set_line_style(style=style)
-
-        if self.legend is None:
-            # Line color (uniform)
-            if isinstance(color, dict):
-                raise TypeError("Line color must be a string when legend is not set.")
-            if isinstance(color, str):
-                for line in lines.standard():
-                    self._style(line).set_line_color(color=color)
-
-            # Line alpha (uniform)
-            if isinstance(alpha, dict):
-                raise TypeError("Line alpha must be a float when legend is not set.")
-            if isinstance(alpha, float):
-                for line in lines.standard():
-                    self._style(line).set_line_alpha(alpha=alpha)
-
-            # Line style (uniform)
-            if isinstance(style, dict):
-                raise TypeError("Line style must be a string when legend is not set.")
-            if isinstance(style, str):
-                for line in lines.standard():
-                    self._style(line).set_line_style(style=style)
+        self._draw(color, alpha, style)
+
+    def _draw_legend(
+        self,
+        color: str | dict[str, str] | None,
+        alpha: float | dict[str, float] | None,
+        style: str | dict[str, str] | None,
+    ) -> None:
+        """Apply legend-mapped line properties (legend mode draw())."""
+        # Validate every argument before mutating any artist.
+        color = resolve_style_value(color, str, "Line color", legend=True)
+        alpha = resolve_style_value(alpha, float, "Line alpha", legend=True)
+        style = resolve_style_value(style, str, "Line style", legend=True)
+        if color is None and alpha is None and style is None:
+            return
+        self.helper.validate_legend_entries(color, alpha, style)
+
+        # Line color, alpha and style (legend-mapped), in one pass.
+        for line, values in LineYielder(ax=self.ax).map_legends(color, alpha, style):
+            _apply_line_style(line, *values)
+
+    def _draw_uniform(
+        self,
+        color: str | dict[str, str] | None,
+        alpha: float | dict[str, float] | None,
+        style: str | dict[str, str] | None,
+    ) -> None:
+        """Apply line properties to every line (uniform mode draw())."""
+        # Validate every argument before mutating any artist.
+        color = resolve_style_value(color, str, "Line color", legend=False)
+        alpha = resolve_style_value(alpha, float, "Line alpha", legend=False)
+        style = resolve_style_value(style, str, "Line style", legend=False)
+        if color is None and alpha is None and style is None:
+            return
+
+        # Line color, alpha and style (uniform): one setp call for the shared
+        # properties, then per-line alpha only when no color was given.
+        lines = list(LineYielder(ax=self.ax).standard())
+        artist.setp(lines, **_uniform_line_properties(color, alpha, style))
+        if color is None and alpha is not None:
+            for line in lines:
+                line.set_color(rgba_with_alpha(line.get_color(), alpha))
@@ -1,124 +1,122 @@
 """Style Line2D marker."""
 
+from matplotlib import artist
 from matplotlib.axes import Axes
-from matplotlib.colors import to_rgba
 from matplotlib.lines import Line2D
 
-from ._utils import LineStyleHelper, LineYielder
-
-
-class MarkerStyler:
-    """Apply marker styling to a single Line2D artist."""
-
-    def __init__(self, line: Line2D):
-        """
-        Args:
-            line (Line2D): Line artist to style.
-        """
-        self.line = line
-
-    def set_marker(self, marker: str | None) -> None:
-        """Set the marker style for the line.
-
-        Args:
-            marker (str | None): Matplotlib marker style string. If None, no
-                change is applied.
-
-        Notes:
-            Matplotlib supports many marker strings; see the Matplotlib marker
-            documentation for the full set.
-        """
-        if marker is not None:
-            self.line.set_marker(marker)
-
-    def set_marker_color(self, color: str | None) -> None:
-        """Set the marker face color.
-
-        Args:
-            color (str | None): Matplotlib-compatible color string. If None, no
-                change is applied.
-
-        Notes:
-            Resets the global alpha (line.set_alpha(None)) so the alpha channel
-            in the RGBA marker face color is respected.
-        """
-        self.line.set_alpha(None)
-        if color is not None:
-            r, g, b, a = to_rgba(color)
-            self.line.set_markerfacecolor((r, g, b, a))
-
-    def set_marker_alpha(self, alpha: float | None) -> None:
-        """Override the alpha channel of the marker face color.
-
-        Args:
-            alpha (float | None): Alpha value in [0.0, 1.0]. If None, no change
-                is applied.
-
-        Notes:
-            Resets the global alpha (line.set_alpha(None)) so the alpha channel
-            in the RGBA marker face color is respected.
-        """
-        self.line.set_alpha(None)
-        if alpha is not None:
-            r, g, b, _ = to_rgba(self.line.get_markerfacecolor())
-            self.line.set_markerfacecolor((r, g, b, alpha))
-
-    def set_marker_size(self, size: int | None) -> None:
-        """Set the marker size.
-
-        Args:
-            size (int | None): Marker size in points. If None, no change is
-                applied.
-        """
-        if size is not None:
-            self.line.set_markersize(size)
-
-    def set_marker_edge_color(self, color: str | None) -> None:
-        """Set the marker edge color.
-
-        Args:
-            color (str | None): Matplotlib-compatible color string. If None, no
-                change is applied.
-
-        Notes:
-            Resets the global alpha (line.set_alpha(None)) so the alpha channel
-            in the RGBA marker edge color is respected.
-        """
-        self.line.set_alpha(None)
-        if color is not None:
-            r, g, b, a = to_rgba(color)
-            self.line.set_markeredgecolor((r, g, b, a))
-
-    def set_marker_edge_alpha(self, alpha: float | None) -> None:
-        """Override the alpha channel of the marker edge color.
-
-        Args:
-            alpha (float | None): Alpha value in [0.0, 1.0]. If None, no change
-                is applied.
-
-        Notes:
-            Resets the global alpha (line.set_alpha(None)) so the alpha channel
-            in the RGBA marker edge color is respected.
-        """
-        self.line.set_alpha(None)
-        if alpha is not None:
-            r, g, b, _ = to_rgba(self.line.get_markeredgecolor())
-            self.line.set_markeredgecolor((r, g, b, alpha))
-
-    def set_marker_edge_width(self, width: float | None) -> None:
-        """Set the marker edge line width.
-
-        Args:
-            width (float | None): Marker edge width in points. If None, no
-                change is applied.
-        """
-        if width is not None:
-            self.line.set_markeredgewidth(width)
+from ._utils import (
+    LineStyleHelper,
+    LineYielder,
+    resolve_style_value,
+    rgba_with_alpha,
+)
+
+# MarkerDrawer.draw() arguments, in signature order: (error name, scalar type)
+_MARKER_ARGUMENTS: tuple[tuple[str, type], ...] = (
+    ("Marker", str),
+    ("Marker face color", str),
+    ("Marker face alpha", float),
+    ("Marker size", int),
+    ("Marker edge color", str),
+    ("Marker edge alpha", float),
+    ("Marker edge width", float),
+)
+
+
+def _resolve_marker_values(values: tuple, legend: bool) -> tuple:
+    """Resolve MarkerDrawer.draw() arguments with resolve_style_value()."""
+    return tuple(
+        resolve_style_value(value, scalar, name, legend)
+        for value, (name, scalar) in zip(values, _MARKER_ARGUMENTS, strict=True)
+    )
+
+
+def _apply_marker_style(
+    line: Line2D,
+    marker: str | None,
+    face_color: str | None,
+    face_alpha: float | None,
+    size: int | None,
+    edge_color: str | None,
+    edge_alpha: float | None,
+    edge_width: float | None,
+) -> None:
+    """Apply the non-None marker properties in MarkerDrawer.draw() order.
+
+    Any color or alpha resets the global line alpha so the alpha channel of
+    the RGBA colors is respected; a color given together with its alpha is
+    parsed once with the alpha folded in.
+    """
+    if marker is not None:
+        line.set_marker(marker)
+    if (
+        face_color is not None
+        or face_alpha is not None
+        or edge_color is not None
+        or edge_alpha is not None
+    ):
+        # Reset global alpha so the alpha channel in the RGBA colors is used.
+        line.set_alpha(None)
+    if face_color is not None:
+        # Fold alpha into the parsed color: one setter call, no re-parse.
+        line.set_markerfacecolor(rgba_with_alpha(face_color, face_alpha))
+    elif face_alpha is not None:
+        line.set_markerfacecolor(
+            rgba_with_alpha(line.get_markerfacecolor(), face_alpha)
+        )
+    if size is not None:
+        line.set_markersize(size)
+    if edge_color is not None:
+        line.set_markeredgecolor(rgba_with_alpha(edge_color, edge_alpha))
+    elif edge_alpha is not None:
+        line.set_markeredgecolor(
+            rgba_with_alpha(line.get_markeredgecolor(), edge_alpha)
+        )
+    if edge_width is not None:
+        line.set_markeredgewidth(edge_width)
+
+
+def _uniform_marker_properties(
+    marker: str | None,
+    face_color: str | None,
+    face_alpha: float | None,
+    size: int | None,
+    edge_color: str | None,
+    edge_alpha: float | None,
+    edge_width: float | None,
+) -> dict[str, object]:
+    """Return Line2D.set() keyword arguments shared by every line.
+
+    A face/edge alpha without its color is left out: it depends on each
+    line's own marker color.
+    """
+    properties: dict[str, object] = {}
+    if marker is not None:
+        properties["marker"] = marker
+    if (
+        face_color is not None
+        or face_alpha is not None
+        or edge_color is not None
+        or edge_alpha is not None
+    ):
+        # Reset global alpha so the alpha channel in the RGBA colors is used.
+        properties["alpha"] = None
+    if face_color is not None:
+        properties["markerfacecolor"] = rgba_with_alpha(face_color, face_alpha)
+    if size is not None:
+        properties["markersize"] = size
+    if edge_color is not None:
+        properties["markeredgecolor"] = rgba_with_alpha(edge_color, edge_alpha)
+    if edge_width is not None:
+        properties["markeredgewidth"] = edge_width
+    return properties
 
 
 class MarkerDrawer:
     """Apply marker styling across Line2D artists on an Axes."""
 
+    __slots__ = ("_draw", "ax", "helper", "legend")
+
     def __init__(self, ax: Axes, legend: str | None) -> None:
         """
         Args:
@@ -130,10 +128,8 @@ class MarkerDrawer:
         self.ax = ax
         self.legend = legend
         self.helper = LineStyleHelper(ax=self.ax)
-
-    def _style(self, line: Line2D) -> MarkerStyler:
-        """Create a MarkerStyler for a given line artist."""
-        return MarkerStyler(line=line)
+        # The mode is fixed for the drawer's lifetime: bind its draw once.
+        self._draw = self._draw_legend if legend is not None else self._draw_uniform
 
     def draw(
         self,
@@ -191,131 +187,65 @@ class MarkerDrawer:
             This method mutates Line2D artists in place and does not return self
             (not chainable).
         """
-        lines = LineYielder(ax=self.ax)
-
-        if self.legend is not None:
-            # Marker (legend-mapped)
-            if isinstance(marker, str):
-                raise TypeError("Marker must be a dictionary when legend is set.")
-            if isinstance(marker, dict):
-                self.helper.validate_legend_entry(mapping=marker)
-                for line, marker in lines.map_legend(property=marker):
-                    self._style(line=line).set_marker(marker=marker)
-
-            # Marker face color (legend-mapped)
-            if isinstance(face_color, str):
-                raise TypeError(
-                    "Marker face color must be a dictionary when legend is set."
-                )
-            if isinstance(face_color, dict):
-                self.helper.validate_legend_entry(mapping=face_color)
-                for line, color in lines.map_legend(property=face_color):
-                    self._style(line=line).set_marker_color(color=color)
-
-            # Marker face alpha (legend-mapped)
-            if isinstance(face_alpha, float):
-                raise TypeError(
-                    "Marker face alpha must be a dictionary when legend is set."
-                )
-            if isinstance(face_alpha, dict):
-                self.helper.validate_legend_entry(mapping=face_alpha)
-                for line, alpha in lines.map_legend(property=face_alpha):
-                    self._style(line=line).set_marker_alpha(alpha=alpha)
-
-            # Marker size (legend-mapped)
-            if isinstance(size, int):
-                raise TypeError("Marker size must be a dictionary when legend is set.")
-            if isinstance(size, dict):
-                self.helper.validate_legend_entry(mapping=size)
-                for line, size in lines.map_legend(property=size):
-                    self._style(line=line).set_marker_size(size=size)
-
-            # Marker edge color (legend-mapped)
-            if isinstance(edge_color, str):
-                raise TypeError(
-                    "Marker edge color must be a dictionary when legend is set."
-                )
-            if isinstance(edge_color, dict):
-                self.helper.validate_legend_entry(mapping=edge_color)
-                for line, color in lines.map_legend(property=edge_color):
-                    self._style(line=line).set_marker_edge_color(color=color)
+        self._draw(
+            marker, face_color, face_alpha, size, edge_color, edge_alpha, edge_width
+        )
 
-            # Marker edge alpha (legend-mapped)
-            if isinstance(edge_alpha, float):
-                raise TypeError(
-                    "Marker edge alpha must be a dictionary when legend is set."
-                )
-            if isinstance(edge_alpha, dict):
-                self.helper.validate_legend_entry(mapping=edge_alpha)
-                for line, alpha in lines.map_legend(property=edge_alpha):
-                    self._style(line=line).set_marker_edge_alpha(alpha=alpha)
-
-            # Marker edge width (legend-mapped)
-            if isinstance(edge_width, float):
-                raise TypeError(
-                    "Marker edge width must be a dictionary when legend is set."
-                )
-            if isinstance(edge_width, dict):
-                self.helper.validate_legend_entry(mapping=edge_width)
-                for line, width in lines.map_legend(property=edge_width):
-                    self._style(line=line).set_marker_edge_width(width=width)
-
-        if self.legend is None:
-            # Marker (uniform)
-            if isinstance(marker, dict):
-                raise TypeError("Marker must be a string when legend is not set.")
-            if isinstance(marker, str):
-                for line in lines.standard():
-                    self._style(line=line).set_marker(marker=marker)
-
-            # Marker face color (uniform)
-            if isinstance(face_color, dict):
-                raise TypeError(
-                    "Marker face color must be a string when legend is not set."
-                )
-            if isinstance(face_color, str):
-                for line in lines.standard():
-                    self._style(line=line).set_marker_color(color=face_color)
-
-            # Marker face alpha (uniform)
-            if isinstance(face_alpha, dict):
-                raise TypeError(
-                    "Marker face alpha must be a float when legend is not set."
-                )
-            if isinstance(face_alpha, float):
-                for line in lines.standard():
-                    self._style(line=line).set_marker_alpha(alpha=face_alpha)
-
-            # Marker size (uniform)
-            if isinstance(size, dict):
-                raise TypeError("Marker size must be an int when legend is not set.")
-            if isinstance(size, int):
-                for line in lines.standard():
-                    self._style(line=line).set_marker_size(size=size)
-
-            # Marker edge color (uniform)
-            if isinstance(edge_color, dict):
-                raise TypeError(
-                    "Marker edge color must be a string when legend is not set."
-                )
-            if isinstance(edge_color, str):
-                for line in lines.standard():
-                    self._style(line=line).set_marker_edge_color(color=edge_color)
-
-            # Marker edge alpha (uniform)
-            if isinstance(edge_alpha, dict):
-                raise TypeError(
-                    "Marker edge alpha must be a float when legend is not set."
+    def _draw_legend(
+        self,
+        marker: str | dict[str, str] | None,
+        face_color: str | dict[str, str] | None,
+        face_alpha: float | dict[str, float] | None,
+        size: int | dict[str, int] | None,
+        edge_color: str | dict[str, str] | None,
+        edge_alpha: float | dict[str, float] | None,
+        edge_width: float | dict[str, float] | None,
+    ) -> None:
+        """Apply legend-mapped marker properties (legend mode draw())."""
+        # Validate every argument before mutating any artist.
+        values = _resolve_marker_values(
+            (marker, face_color, face_alpha, size, edge_color, edge_alpha, edge_width),
+            legend=True,
+        )
+        if all(value is None for value in values):
+            return
+        self.helper.validate_legend_entries(*values)
+
+        # Marker properties (legend-mapped), in one pass.
+        for line, line_values in LineYielder(ax=self.ax).map_legends(*values):
+            _apply_marker_style(line, *line_values)
+
+    def _draw_uniform(
+        self,
+        marker: str | dict[str, str] | None,
+        face_color: str | dict[str, str] | None,
+        face_alpha: float | dict[str, float] | None,
+        size: int | dict[str, int] | None,
+        edge_color: str | dict[str, str] | None,
+        edge_alpha: float | dict[str, float] | None,
+        edge_width: float | dict[str, float] | None,
+    ) -> None:
+        """Apply marker properties to every line (uniform mode draw())."""
+        # Validate every argument before mutating any artist.
+        values = _resolve_marker_values(
+            (marker, face_color, face_alpha, size, edge_color, edge_alpha, edge_width),
+            legend=False,
+        )
+        if all(value is None for value in values):
+            return
+
+        # Marker properties (uniform): one setp call for the shared
+        # properties, then per-line alphas only where no color was given.
+        _, face_color, face_alpha, _, edge_color, edge_alpha, _ = values
+        lines = list(LineYielder(ax=self.ax).standard())
+        artist.setp(lines, **_uniform_marker_properties(*values))
+        if face_color is None and face_alpha is not None:
+            for line in lines:
+                line.set_markerfacecolor(
+                    rgba_with_alpha(line.get_markerfacecolor(), face_alpha)
                 )
-            if isinstance(edge_alpha, float):
-                for line in lines.standard():
-                    self._style(line=line).set_marker_edge_alpha(alpha=edge_alpha)
-
-            # Marker edge width (uniform)
-            if isinstance(edge_width, dict):
-                raise TypeError(
-                    "Marker edge width must be a float when legend is not set."
+        if edge_color is None and edge_alpha is not None:
+            for line in lines:
+                line.set_markeredgecolor(
+                    rgba_with_alpha(line.get_markeredgecolor(), edge_alpha)
                 )
-            if isinstance(edge_width, float):
-                for line in lines.standard():
-                    self._style(line=line).set_marker_edge_width(width=edge_width)
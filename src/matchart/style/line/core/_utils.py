@@ -1,14 +1,123 @@
 """Utilities for line chart stylers."""
 
-from typing import Iterable, TypeVar, cast
+from functools import lru_cache
+from typing import Any, Iterable, TypeVar, cast
 
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.collections import FillBetweenPolyCollection
+from matplotlib.colors import to_rgba
 from matplotlib.lines import Line2D
+from matplotlib.typing import ColorType
 
 T = TypeVar("T")
 
+# value type -> style value kind (dict, str, float, int or None); subclasses
+# (e.g. bool, numpy.float64) are added on first lookup.
+_VALUE_KINDS: dict[type, type | None] = {
+    dict: dict,
+    str: str,
+    float: float,
+    int: int,
+    type(None): None,
+}
+
+_SCALAR_NAMES: dict[type, str] = {str: "a string", float: "a float", int: "an int"}
+
+
+def _value_kind(value: object) -> type | None:
+    """Return the style value kind of `value` via the type table."""
+    value_type = type(value)
+    try:
+        return _VALUE_KINDS[value_type]
+    except KeyError:
+        kind = next(
+            (_VALUE_KINDS[cls] for cls in value_type.__mro__ if cls in _VALUE_KINDS),
+            None,
+        )
+        _VALUE_KINDS[value_type] = kind
+        return kind
+
+
+@lru_cache(maxsize=512)
+def _to_rgba_cached(color: str) -> tuple[float, float, float, float]:
+    """Return `to_rgba(color)`, memoized for colors reused across artists."""
+    return to_rgba(color)
+
+
+def as_rgba(color: ColorType) -> tuple[float, float, float, float]:
+    """Convert a color to RGBA, caching string inputs only.
+
+    RGBA tuples of floats in [0, 1] (e.g. colors read back from an artist
+    styled earlier) are returned as-is without going through to_rgba.
+    """
+    if isinstance(color, str):
+        return _to_rgba_cached(color)
+    if (
+        isinstance(color, tuple)
+        and len(color) == 4
+        and all(isinstance(c, float) and 0.0 <= c <= 1.0 for c in color)
+    ):
+        return color
+    return to_rgba(color)
+
+
+@lru_cache(maxsize=512)
+def _rgba_with_alpha_cached(
+    color: str | tuple[float, ...], alpha: float | None
+) -> tuple[float, float, float, float]:
+    """Return `rgba_with_alpha(color, alpha)`, memoized per (color, alpha)."""
+    r, g, b, a = as_rgba(color)
+    return (r, g, b, a if alpha is None else alpha)
+
+
+def rgba_with_alpha(
+    color: ColorType, alpha: float | None
+) -> tuple[float, float, float, float]:
+    """Convert a color to RGBA, replacing its alpha channel unless None.
+
+    String and tuple colors are memoized together with the alpha, so the
+    same (color, alpha) pair applied across artists is resolved once.
+    """
+    if isinstance(color, (str, tuple)):
+        return _rgba_with_alpha_cached(color, alpha)
+    r, g, b, a = to_rgba(color)
+    return (r, g, b, a if alpha is None else alpha)
+
+
+def resolve_style_value(value: Any, scalar: type, name: str, legend: bool) -> Any:
+    """Check a drawer argument against the legend mode and return its value.
+
+    Args:
+        value (Any): Argument passed to a drawer's draw() method.
+        scalar (type): Scalar type accepted when legend is not set (str,
+            float or int).
+        name (str): Property name used in error messages (e.g. "Line color").
+        legend (bool): Whether the drawer is in legend mode.
+
+    Returns:
+        Any: The dict (legend mode) or scalar (uniform mode) to apply, or None
+        when the value is of any other type and should be ignored.
+
+    Raises:
+        TypeError: If legend is set and a scalar is provided instead of a
+            dict, or if legend is not set and a dict is provided.
+    """
+    kind = _value_kind(value)
+    if legend:
+        if kind is dict:
+            return value
+        if kind is scalar:
+            raise TypeError(f"{name} must be a dictionary when legend is set.")
+        return None
+    if kind is scalar:
+        return value
+    if kind is dict:
+        raise TypeError(
+            f"{name} must be {_SCALAR_NAMES[scalar]} when legend is not set."
+        )
+    return None
+
 
 class LineStyleHelper:
     """Inspect line-chart artists and metadata on an Axes.
@@ -18,6 +127,8 @@ class LineStyleHelper:
     - Mapping legend labels to per-line style values.
     """
 
+    __slots__ = ("ax",)
+
     def __init__(self, ax: Axes) -> None:
         """
         Args:
@@ -62,15 +173,37 @@ class LineStyleHelper:
             ValueError: If any mapping keys are not present in the Axes line
                 legend labels. The error message includes the available labels.
         """
-        legend_labels = self.get_legend_labels()
-        dict_keys = set(mapping.keys())
-        valid_labels = set(legend_labels)
-        invalid_keys = dict_keys - valid_labels
-        if invalid_keys:
-            raise ValueError(
-                f"Invalid legend labels in dictionary keys: {invalid_keys}. "
-                f"Available legend labels are: {legend_labels}"
-            )
+        self.validate_legend_entries(mapping)
+
+    def validate_legend_entries(self, *mappings: dict[str, T] | None) -> None:
+        """Validate several mappings against the line legend labels at once.
+
+        The legend labels are collected once and every non-None mapping is
+        checked against them, in order.
+
+        Args:
+            *mappings (dict[str, T] | None): Mappings from legend label text to
+                a property value. None entries are skipped.
+
+        Raises:
+            ValueError: If any keys of a mapping are not present in the Axes
+                line legend labels. Raised for the first such mapping; the
+                error message includes the available labels.
+        """
+        legend_labels: list[str] | None = None
+        valid_labels: set[str] = set()
+        for mapping in mappings:
+            if mapping is None:
+                continue
+            if legend_labels is None:
+                legend_labels = self.get_legend_labels()
+                valid_labels = set(legend_labels)
+            invalid_keys = mapping.keys() - valid_labels
+            if invalid_keys:
+                raise ValueError(
+                    f"Invalid legend labels in dictionary keys: {invalid_keys}. "
+                    f"Available legend labels are: {legend_labels}"
+                )
 
     def get_point_value(self, line: Line2D, tick_label: str) -> float:
         """Return the line's y-value at the index corresponding to tick_label.
@@ -97,7 +230,13 @@ class LineStyleHelper:
 
 
 class LineYielder:
-    """Yield Line2D artists from an Axes, optionally paired with mapped values."""
+    """Yield Line2D artists from an Axes, optionally paired with mapped values.
+
+    Legend-mapped lookups share a label index built on first use, so create a
+    new yielder after adding or relabelling lines.
+    """
+
+    __slots__ = ("_by_label", "ax")
 
     def __init__(self, ax: Axes) -> None:
         """
@@ -105,6 +244,16 @@ class LineYielder:
             ax (Axes): Axes that already contains line artists.
         """
         self.ax = ax
+        self._by_label: dict[str, list[Line2D]] | None = None
+
+    def _index(self) -> dict[str, list[Line2D]]:
+        """Return the Axes lines grouped by legend label."""
+        if self._by_label is None:
+            by_label: dict[str, list[Line2D]] = {}
+            for line in self.ax.lines:
+                by_label.setdefault(cast(str, line.get_label()), []).append(line)
+            self._by_label = by_label
+        return self._by_label
 
     def standard(self) -> Iterable[Line2D]:
         """Yield all Line2D objects on the Axes.
@@ -126,14 +275,43 @@ class LineYielder:
             tuple[Line2D, T]: (line, value) for lines whose labels exist in the
             mapping.
         """
-        for line in self.ax.lines:
-            prop = property.get(cast(str, line.get_label()))
+        index = self._index()
+        for label, prop in property.items():
             if prop is not None:
-                yield line, prop
+                for line in index.get(label, ()):
+                    yield line, prop
+
+    def map_legends(
+        self, *properties: dict[str, T] | None
+    ) -> Iterable[tuple[Line2D, tuple[T | None, ...]]]:
+        """Yield lines paired with values from several legend mappings.
+
+        Args:
+            *properties (dict[str, T] | None): Mappings from line legend label
+                text to a value. None entries are skipped.
+
+        Yields:
+            tuple[Line2D, tuple[T | None, ...]]: (line, values) for lines whose
+            label exists in at least one mapping, with one value per mapping
+            (None where the mapping is None or lacks the label).
+        """
+        for label, lines in self._index().items():
+            values = tuple(
+                None if prop is None else prop.get(label) for prop in properties
+            )
+            if any(value is not None for value in values):
+                for line in lines:
+                    yield line, values
 
 
 class AreaYielder:
-    """Yield fill_between area artists from an Axes, optionally legend-mapped."""
+    """Yield fill_between area artists from an Axes, optionally legend-mapped.
+
+    Legend-mapped lookups share a label index built on first use, so create a
+    new yielder after adding areas.
+    """
+
+    __slots__ = ("_by_label", "ax")
 
     def __init__(self, ax: Axes) -> None:
         """
@@ -141,6 +319,18 @@ class AreaYielder:
             ax (Axes): Axes that already contains fill_between artists.
         """
         self.ax = ax
+        self._by_label: dict[str, list[FillBetweenPolyCollection]] | None = None
+
+    def _index(self) -> dict[str, list[FillBetweenPolyCollection]]:
+        """Return the Axes fill_between areas grouped by legend label."""
+        if self._by_label is None:
+            by_label: dict[str, list[FillBetweenPolyCollection]] = {}
+            for area in self.standard():
+                legend_label = getattr(area, "_legend_label", None)
+                if legend_label is not None:
+                    by_label.setdefault(legend_label, []).append(area)
+            self._by_label = by_label
+        return self._by_label
 
     def standard(self) -> Iterable[FillBetweenPolyCollection]:
         """Yield all fill_between area artists on the Axes.
@@ -170,10 +360,8 @@ class AreaYielder:
             This method attempts to read a legend label from the private
             attribute "_legend_label". This is not a stable Matplotlib API.
         """
-        for area in self.ax.collections:
-            if isinstance(area, FillBetweenPolyCollection):
-                legend_label = getattr(area, "_legend_label", None)
-                if legend_label is not None:
-                    prop = property.get(legend_label)
-                    if prop is not None:
-                        yield area, prop
+        index = self._index()
+        for label, prop in property.items():
+            if prop is not None:
+                for area in index.get(label, ()):
+                    yield area, prop
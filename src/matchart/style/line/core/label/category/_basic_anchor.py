@@ -8,6 +8,8 @@ from matchart.style.line.core._utils import LineStyleHelper
 class CBDL_Line_Anchor:
     """Resolve anchor coordinates for a category-level line label."""
 
+    __slots__ = ("ax", "tick_label")
+
     def __init__(self, ax: Axes, tick_label: str):
         """
         Args:
@@ -0,0 +1,14 @@
+import matplotlib
+import matplotlib.pyplot as plt
+import pytest
+
+matplotlib.use("Agg")
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    ax.plot(range(10))
+    fig.canvas.draw()
+    yield ax
+    plt.close(fig)
@@ -0,0 +1,33 @@
+import warnings
+
+from matchart.style.base.core.legend import main as legend_main
+from matchart.style.base.core.legend.main import LegendStyler
+
+
+def test_frame_without_properties_resets_alpha(ax):
+    ax.lines[0].set_label("a")
+    LegendStyler(ax).frame().draw()
+
+    frame = ax.get_legend().get_frame()
+    assert frame.get_alpha() is None
+    assert frame.get_facecolor() == (1.0, 1.0, 1.0, 1.0)
+
+
+def test_frame_and_title_accept_list_colors(ax):
+    ax.lines[0].set_label("a")
+    styler = LegendStyler(ax).frame(face_color=[1, 0, 0], border_color=[0, 0, 1])
+    styler.title("Series", color=[0, 1, 0]).draw()
+
+    legend = ax.get_legend()
+    assert legend.get_frame().get_facecolor() == (1.0, 0.0, 0.0, 1.0)
+    assert legend.get_frame().get_edgecolor() == (0.0, 0.0, 1.0, 1.0)
+
+
+def test_best_position_warns_once(ax, monkeypatch):
+    monkeypatch.setattr(legend_main, "_best_position_warned", False)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        LegendStyler(ax).position("best")
+        LegendStyler(ax).position("best")
+
+    assert len(caught) == 1
@@ -0,0 +1,48 @@
+from matchart.style.base.core.axis.core.tick._tick_marker import (
+    BatchedMarkerArtist,
+    MajorMarkerDrawer,
+)
+
+
+def _batches(ax):
+    return [a for a in ax.get_children() if isinstance(a, BatchedMarkerArtist)]
+
+
+def test_batched_markers_stay_out_of_lines(ax):
+    MajorMarkerDrawer(ax.xaxis).draw(size=9, use_collection=True)
+
+    assert len(_batches(ax)) == 1
+    assert len(ax.lines) == 1
+    assert not any(t.tick1line.get_visible() for t in ax.xaxis.get_major_ticks())
+
+
+def test_switching_back_to_tick_lines_restores_them(ax):
+    MajorMarkerDrawer(ax.xaxis).draw(size=9, use_collection=True)
+    MajorMarkerDrawer(ax.xaxis).draw(size=20)
+
+    ticks = ax.xaxis.get_major_ticks()
+    assert _batches(ax) == []
+    assert all(t.tick1line.get_visible() for t in ticks)
+    assert all(t.tick1line.get_markersize() == 20 for t in ticks)
+
+
+def test_switching_modes_twice_keeps_one_batch(ax):
+    drawer = MajorMarkerDrawer(ax.xaxis)
+    drawer.draw(use_collection=True)
+    drawer.draw()
+    drawer.draw(size=12, use_collection=True)
+
+    batches = _batches(ax)
+    assert len(batches) == 1
+    assert batches[0].line.get_markersize() == 12
+    assert not any(t.tick1line.get_visible() for t in ax.xaxis.get_major_ticks())
+
+
+def test_disabled_batch_stays_hidden_after_switching_back(ax):
+    drawer = MajorMarkerDrawer(ax.xaxis)
+    drawer.draw(use_collection=True)
+    drawer.enable(False)
+    drawer.draw()
+
+    assert _batches(ax) == []
+    assert not any(t.tick1line.get_visible() for t in ax.xaxis.get_major_ticks())
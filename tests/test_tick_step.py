@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from matplotlib.ticker import MultipleLocator
+
+from matchart.style.base.core.axis.core.tick._tick_marker import (
+    MajorMarkerDrawer,
+    _multiple_tick_count,
+)
+
+_INTERVALS = [
+    (0.0, 10.0, 1.0),
+    (10.0, 0.0, 1.0),
+    (-0.5, 9.5, 1.0),
+    (0.3, 0.9, 0.1),
+    (1e-11, 5.0, 1.0),
+    (-1e-11, 5.0, 1.0),
+    (1.0 - 1e-11, 7.0, 0.5),
+    (2.0, 2.999, 1.0),
+    (0.0, 100.0, 7.0),
+    (-3.3, 3.3, 1.1),
+]
+
+
+@pytest.mark.parametrize("vmin, vmax, step", _INTERVALS)
+def test_tick_count_matches_multiple_locator(vmin, vmax, step):
+    expected = len(MultipleLocator(step).tick_values(vmin, vmax))
+    assert _multiple_tick_count(vmin, vmax, step) == expected
+
+
+def test_tick_count_matches_multiple_locator_on_random_intervals():
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        vmin, vmax = rng.uniform(-50, 50, size=2)
+        step = float(rng.choice([0.1, 0.25, 1.0, 2.0, 5.0]))
+        # Snap some edges onto a multiple of the step.
+        if rng.random() < 0.5:
+            vmin = round(vmin / step) * step
+        expected = len(MultipleLocator(step).tick_values(vmin, vmax))
+        assert _multiple_tick_count(vmin, vmax, step) == expected
+
+
+def test_step_with_too_many_ticks_raises(ax):
+    ax.set_xlim(0, 100)
+    with pytest.raises(ValueError, match="increase step size"):
+        MajorMarkerDrawer(ax.xaxis).draw(step=1)